@@ -1,14 +1,35 @@
 """Build script for creating executable with PyInstaller."""
+import hashlib
+import json
 import os
 import shutil
 import subprocess
 import sys
+import tempfile
 import venv
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
 
+from build_common import (
+    APP_NAME,
+    EXCLUDED_MODULES,
+    HIDDEN_IMPORTS,
+    POST_BUILD_CLEANUP_DLLS,
+    POST_BUILD_CLEANUP_PLUGINS,
+    find_icon,
+    strip_binaries,
+)
+
 # Project root (directory containing build.py)
 PROJECT_ROOT = Path(__file__).resolve().parent
 BUILD_VENV_DIR = PROJECT_ROOT / ".build_venv"
+# Set before re-exec'ing into the build venv so the child skips venv probing
+BUILD_VENV_ENV_VAR = "FLOATTIME_BUILD_VENV_ACTIVE"
+# Hash of requirements.txt the build venv was last provisioned from
+REQ_HASH_FILE = BUILD_VENV_DIR / ".req_hash"
+# Cached pip wheel used to seed fresh stdlib venvs (avoids ensurepip)
+BUILD_VENV_CACHE_DIR = PROJECT_ROOT / ".build_venv_cache"
 
 
 def _in_build_venv():
@@ -19,15 +40,120 @@ def _in_build_venv():
         return False
 
 
+# Module -> pip package providing it, for the build dependency checks
+BUILD_DEP_MODULES = {
+    "PyQt6.QtCore": "PyQt6",
+    "websocket": "websocket-client",
+    "socketio": "python-socketio",
+    "engineio": "python-socketio",  # pulled in by python-socketio
+}
+
+
+def _has_module(name: str) -> bool:
+    """True if module is importable; locates its spec without executing it."""
+    try:
+        return find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
 def _current_env_has_deps():
     """True if current environment has all build dependencies."""
+    return all(_has_module(m) for m in BUILD_DEP_MODULES)
+
+
+def _venv_python() -> Path:
+    """Path to the build venv's Python interpreter."""
+    if os.name == "nt":
+        return BUILD_VENV_DIR / "Scripts" / "python.exe"
+    return BUILD_VENV_DIR / "bin" / "python"
+
+
+def _create_build_venv():
+    """
+    Create .build_venv with the fastest available tool.
+    Prefer uv (copies from its wheel cache), then virtualenv (seeds pip from
+    its app-data cache instead of running ensurepip), then stdlib venv.
+    Returns the uv executable path if uv created the venv, else None.
+    """
+    uv = shutil.which("uv")
+    if uv:
+        print(f"Creating build venv at {BUILD_VENV_DIR} (uv)...")
+        subprocess.run([uv, "venv", str(BUILD_VENV_DIR)], check=True, cwd=str(PROJECT_ROOT))
+        return uv
+
+    virtualenv = shutil.which("virtualenv")
+    if virtualenv:
+        print(f"Creating build venv at {BUILD_VENV_DIR} (virtualenv)...")
+        subprocess.run([virtualenv, str(BUILD_VENV_DIR)], check=True, cwd=str(PROJECT_ROOT))
+        return None
+
+    print(f"Creating build venv at {BUILD_VENV_DIR}...")
+    # Symlink the interpreter instead of copying it where the OS allows
+    venv.create(BUILD_VENV_DIR, with_pip=False, symlinks=(os.name != "nt" or _windows_symlink_allowed()))
+    _seed_pip(_venv_python())
+    return None
+
+
+def _windows_symlink_allowed() -> bool:
+    """
+    True if this process may create symlinks on Windows (Developer Mode enabled
+    or running elevated). Enabling Developer Mode unlocks the symlinked build venv.
+    """
     try:
-        import PyQt6.QtCore  # noqa: F401
-        import websocket  # noqa: F401
-        import socketio  # noqa: F401
-        import engineio  # noqa: F401
+        with tempfile.TemporaryDirectory() as tmp:
+            os.symlink(os.path.join(tmp, "a"), os.path.join(tmp, "b"))
         return True
-    except ImportError:
+    except (OSError, NotImplementedError):
+        return False
+
+
+def _seed_pip(venv_python: Path):
+    """
+    Install pip into a fresh venv from a cached wheel, like virtualenv does,
+    instead of paying for ensurepip. The wheel is downloaded once into
+    .build_venv_cache with the outer interpreter's pip; ensurepip is the fallback.
+    """
+    wheels = list(BUILD_VENV_CACHE_DIR.glob("pip-*.whl"))
+    if not wheels:
+        subprocess.run(
+            [sys.executable, "-m", "pip", "download", "--only-binary=:all:", "--no-deps",
+             "--disable-pip-version-check", "--dest", str(BUILD_VENV_CACHE_DIR), "pip"],
+            cwd=str(PROJECT_ROOT),
+        )
+        wheels = list(BUILD_VENV_CACHE_DIR.glob("pip-*.whl"))
+    if wheels:
+        wheel = max(wheels, key=lambda p: p.stat().st_mtime)
+        # A pip wheel is runnable as a zip: <wheel>/pip installs itself from the wheel
+        subprocess.run(
+            [str(venv_python), str(wheel / "pip"), "install", "--no-index", "--no-deps",
+             "--disable-pip-version-check", str(wheel)],
+            check=True,
+            cwd=str(PROJECT_ROOT),
+        )
+        return
+    subprocess.run([str(venv_python), "-Im", "ensurepip", "--default-pip"], check=True)
+
+
+def _venv_created_by_uv() -> bool:
+    """True if .build_venv was created by uv (no pip inside; installs go through uv)."""
+    cfg = BUILD_VENV_DIR / "pyvenv.cfg"
+    try:
+        return any(line.startswith("uv") for line in cfg.read_text().splitlines())
+    except OSError:
+        return False
+
+
+def _requirements_hash(requirements: Path) -> str:
+    """Content hash of requirements.txt."""
+    return hashlib.sha256(requirements.read_bytes()).hexdigest()
+
+
+def _venv_is_provisioned(req_hash: str) -> bool:
+    """True if the build venv was already provisioned from this exact requirements.txt."""
+    try:
+        return REQ_HASH_FILE.read_text().strip() == req_hash
+    except OSError:
         return False
 
 
@@ -37,56 +163,74 @@ def ensure_build_venv():
     If not already in that venv and current env lacks deps, create venv,
     install requirements, and re-exec this script with the venv's Python.
     """
+    if os.environ.get(BUILD_VENV_ENV_VAR):
+        return
     if _in_build_venv():
         return
     if _current_env_has_deps():
         return
 
+    requirements = PROJECT_ROOT / "requirements.txt"
+    if not requirements.exists():
+        raise FileNotFoundError(f"requirements.txt not found in {PROJECT_ROOT}")
+    req_hash = _requirements_hash(requirements)
+
     # Create venv if needed
+    uv = None
     if not BUILD_VENV_DIR.exists():
-        print(f"Creating build venv at {BUILD_VENV_DIR}...")
-        venv.create(BUILD_VENV_DIR, with_pip=True)
-
-    if os.name == "nt":
-        venv_python = BUILD_VENV_DIR / "Scripts" / "python.exe"
-    else:
-        venv_python = BUILD_VENV_DIR / "bin" / "python"
+        uv = _create_build_venv()
+    elif _venv_created_by_uv():
+        uv = shutil.which("uv")
 
+    venv_python = _venv_python()
     if not venv_python.exists():
         raise RuntimeError(f"Build venv Python not found: {venv_python}")
 
-    requirements = PROJECT_ROOT / "requirements.txt"
-    if not requirements.exists():
-        raise FileNotFoundError(f"requirements.txt not found in {PROJECT_ROOT}")
-
-    print("Installing build dependencies into .build_venv...")
-    subprocess.run(
-        [str(venv_python), "-m", "pip", "install", "-r", str(requirements)],
-        check=True,
-        cwd=str(PROJECT_ROOT),
-    )
+    # Skip pip entirely when requirements.txt hasn't changed since the last install
+    if _venv_is_provisioned(req_hash):
+        print("Build venv is up to date, skipping dependency install.")
+    else:
+        print("Installing build dependencies into .build_venv...")
+        if uv:
+            cmd = [uv, "pip", "install", "--python", str(venv_python), "-r", str(requirements)]
+        else:
+            # .pyc files are useless here: PyInstaller compiles the app bytecode itself
+            cmd = [
+                str(venv_python), "-m", "pip", "install",
+                "--no-compile", "--disable-pip-version-check",
+                "-r", str(requirements),
+            ]
+        subprocess.run(cmd, check=True, cwd=str(PROJECT_ROOT))
+        REQ_HASH_FILE.write_text(req_hash)
 
     # Re-exec this script with the venv's Python
     build_script = Path(__file__).resolve()
+    os.environ[BUILD_VENV_ENV_VAR] = "1"
     os.execv(str(venv_python), [str(venv_python), str(build_script)] + sys.argv[1:])
 
 
+def _remove_plugin_dir(plugin_path: Path):
+    """Delete one PyQt6 plugin directory from the bundle (post-build cleanup)."""
+    if plugin_path.exists():
+        shutil.rmtree(plugin_path, ignore_errors=True)
+        print(f"Removed plugin directory: {plugin_path.name}")
+
+
+def _remove_dll(dll_file: Path):
+    """Delete one unwanted DLL from the bundle (post-build cleanup)."""
+    try:
+        dll_file.unlink()
+        print(f"Removed DLL: {dll_file.name}")
+    except Exception as e:
+        print(f"Warning: Could not remove {dll_file.name}: {e}")
+
+
 def check_build_dependencies():
     """Verify all packages required for the frozen app are installed. Exit with clear message if not."""
     missing = []
-    try:
-        import PyQt6.QtCore  # noqa: F401
-    except ImportError:
-        missing.append("PyQt6")
-    try:
-        import websocket  # noqa: F401  # from websocket-client package
-    except ImportError:
-        missing.append("websocket-client")
-    try:
-        import socketio  # noqa: F401  # from python-socketio (pulls in engineio)
-        import engineio  # noqa: F401
-    except ImportError:
-        missing.append("python-socketio")
+    for module, package in BUILD_DEP_MODULES.items():
+        if package not in missing and not _has_module(module):
+            missing.append(package)
     if missing:
         print("Missing required packages for build:", ", ".join(missing))
         print("Install them with: pip install -r requirements.txt")
@@ -94,159 +238,116 @@ def check_build_dependencies():
         sys.exit(1)
 
 
-def build():
-    """Build the application executable."""
-    import PyInstaller.__main__
-
-    check_build_dependencies()
-
-    app_name = "floattime"
-
+def _build_pyinstaller_args(rebuild: bool = False) -> list:
+    """PyInstaller CLI arguments equivalent to floattime.spec."""
     # Determine separator for --add-data (Windows uses ;, Unix uses :)
     separator = ";" if sys.platform == "win32" else ":"
-    
-    # PyInstaller arguments
+
     # Using --onedir instead of --onefile for faster startup (no extraction needed)
     args = [
         "src/main.py",
-        "--name", app_name,
+        "--name", APP_NAME,
         "--onedir",  # Faster startup than --onefile (no temp extraction)
         "--windowed",  # No console window
         "--noupx",  # Disable UPX compression (faster startup)
         "--paths", "src",  # Add src to Python path
         f"--add-data=src{separator}src",  # Include src directory
-        # Hidden imports
-        "--hidden-import", "config",
-        "--hidden-import", "ontime_client",
-        "--hidden-import", "timer_widget",
-        "--hidden-import", "tray_manager",
-        "--hidden-import", "logger",
-        "--hidden-import", "ui.config_dialog",
-        "--hidden-import", "PyQt6.QtCore",
-        "--hidden-import", "PyQt6.QtWidgets",
-        "--hidden-import", "PyQt6.QtGui",
-        "--hidden-import", "requests",
-        "--hidden-import", "websocket",
-        "--hidden-import", "websocket_client",
-        "--hidden-import", "socketio",
-        "--hidden-import", "engineio",
-        # Exclude unused modules to reduce size and startup time
-        "--exclude-module", "matplotlib",
-        "--exclude-module", "numpy",
-        "--exclude-module", "pandas",
-        "--exclude-module", "scipy",
-        "--exclude-module", "PIL",
-        "--exclude-module", "tkinter",
-        "--exclude-module", "PyQt5",
-        "--exclude-module", "PySide2",
-        "--exclude-module", "PySide6",
-        "--exclude-module", "PyQt6.QtMultimedia",
-        "--exclude-module", "PyQt6.QtMultimediaWidgets",
-        "--exclude-module", "PyQt6.QtWebEngineCore",
-        "--exclude-module", "PyQt6.QtWebEngineWidgets",
-        "--exclude-module", "PyQt6.QtQuick",
-        "--exclude-module", "PyQt6.QtQuickWidgets",
-        "--exclude-module", "PyQt6.QtQml",
-        "--exclude-module", "PyQt6.QtSql",
-        "--exclude-module", "PyQt6.QtNetworkAuth",
-        "--exclude-module", "PyQt6.QtBluetooth",
-        "--exclude-module", "PyQt6.QtNfc",
-        "--exclude-module", "PyQt6.QtPositioning",
-        "--exclude-module", "PyQt6.QtSensors",
-        "--exclude-module", "PyQt6.QtSerialPort",
-        "--exclude-module", "PyQt6.QtWebChannel",
-        "--exclude-module", "PyQt6.QtXml",
-        "--exclude-module", "PyQt6.QtTest",
-        "--exclude-module", "PyQt6.QtDesigner",
-        "--exclude-module", "PyQt6.QtPrintSupport",
-        "--exclude-module", "PyQt6.QtOpenGL",
-        "--exclude-module", "PyQt6.QtOpenGLWidgets",
-        "--exclude-module", "PyQt6.QtPdf",
-        "--exclude-module", "PyQt6.QtPdfWidgets",
-        # Exclude unused standard library components
-        "--exclude-module", "unittest",
-        "--exclude-module", "pydoc",
-        "--exclude-module", "html",
-        "--exclude-module", "http.server",
-        "--exclude-module", "distutils",
-        "--exclude-module", "setuptools",
-        "--exclude-module", "lib2to3",
-        # Custom hook in hooks/ directory will handle PyQt6 plugin collection
-        # Only essential plugins (platforms, styles) will be included
-        # Optimize Python bytecode
-        "--optimize", "2",
-        "--clean",
-        "--noconfirm",
     ]
+    for module in HIDDEN_IMPORTS:
+        args += ["--hidden-import", module]
+    for module in EXCLUDED_MODULES:
+        args += ["--exclude-module", module]
+    # Custom hook in hooks/ directory will handle PyQt6 plugin collection
+    # Only essential plugins (platforms, styles) will be included
+    # Optimize Python bytecode
+    args += ["--optimize", "2", "--noconfirm"]
+
+    # Keep PyInstaller's build/ cache between runs; wipe it only on --rebuild
+    if rebuild:
+        args.append("--clean")
+    # --noarchive was evaluated and left off: loose .pyc files mean many more file
+    # opens at startup than reading from the single PYZ archive.
+    if strip_binaries(sys.platform):
+        args.append("--strip")
+
+    icon = find_icon(PROJECT_ROOT)
+    if icon:
+        args.extend(["--icon", icon])
+    return args
+
+
+def build():
+    """Build the application executable."""
+    # Persistent PyInstaller cache that survives clean checkouts (read at PyInstaller import)
+    os.environ.setdefault("PYINSTALLER_CONFIG_DIR", str(PROJECT_ROOT / ".pyinstaller_cache"))
+    import PyInstaller.__main__
+
+    check_build_dependencies()
+
+    rebuild = "--rebuild" in sys.argv[1:]
     
-    # Add icon if it exists
-    icon_path = Path("icon.ico")
-    if not icon_path.exists():
-        icon_path = Path("icon.png")
-    
-    if icon_path.exists():
-        args.extend(["--icon", str(icon_path)])
-    
-    print(f"Building {app_name}...")
+    print(f"Building {APP_NAME}...")
     print(f"Platform: {sys.platform}")
-    PyInstaller.__main__.run(args)
+    spec_file = PROJECT_ROOT / f"{APP_NAME}.spec"
+    if spec_file.exists():
+        spec_args = [str(spec_file), "--noconfirm"]
+        if rebuild:
+            spec_args.append("--clean")
+        PyInstaller.__main__.run(spec_args)
+    else:
+        PyInstaller.__main__.run(_build_pyinstaller_args(rebuild))
     
     # Post-build cleanup: Remove unnecessary PyQt6 plugins and DLLs
-    dist_path = Path("dist") / app_name / "_internal"
+    dist_path = Path("dist") / APP_NAME / "_internal"
     pyqt6_bin_path = dist_path / "PyQt6" / "Qt6" / "bin"
     pyqt6_plugins_path = dist_path / "PyQt6" / "Qt6" / "plugins"
     
-    # List of plugin directories to remove (everything except platforms and styles)
-    excluded_plugins = [
-        'multimedia', 'mediaservice', 'webengine', 'webview', 'quick', 
-        'qmltooling', 'sqldrivers', 'geoservices', 'position', 
-        'sensorgestures', 'sensors', 'serialbus', 'serialport', 
-        'texttospeech', 'assetimporters', 'sceneparsers', 'renderers', 
-        'printsupport'
-    ]
-    
-    # Remove excluded plugin directories
-    if pyqt6_plugins_path.exists():
-        for plugin_dir in excluded_plugins:
-            plugin_path = pyqt6_plugins_path / plugin_dir
-            if plugin_path.exists():
-                shutil.rmtree(plugin_path)
-                print(f"Removed plugin directory: {plugin_dir}")
-    
-    # Remove unnecessary DLLs from bin directory
-    if pyqt6_bin_path.exists():
-        unwanted_dlls = [
-            # Multimedia/FFmpeg
-            'avcodec', 'avformat', 'avutil', 'swresample', 'swscale', 'ffmpeg',
-            # 3D/Asset importers
-            'assimp', 'gltf',
-            # PDF (we excluded QtPdf modules)
-            'Qt6Pdf',
-            # WebEngine (we excluded QtWebEngine)
-            'Qt6WebEngine', 'Qt6WebEngineCore', 'Qt6WebEngineWidgets',
-            # Quick/QML (we excluded QtQuick/QtQml)
-            'Qt6Quick', 'Qt6Qml', 'Qt6QuickWidgets',
-            # SQL (we excluded QtSql)
-            'Qt6Sql',
-            # Other excluded modules
-            'Qt6Multimedia', 'Qt6Bluetooth', 'Qt6Positioning', 'Qt6Sensors',
-            'Qt6SerialPort', 'Qt6OpenGL', 'Qt6PrintSupport'
-        ]
-        for dll_pattern in unwanted_dlls:
-            for dll_file in pyqt6_bin_path.glob(f"*{dll_pattern}*"):
-                try:
-                    dll_file.unlink()
-                    print(f"Removed DLL: {dll_file.name}")
-                except Exception as e:
-                    print(f"Warning: Could not remove {dll_file.name}: {e}")
+    # Remove excluded plugin directories and unnecessary DLLs.
+    # Each delete is an independent, syscall-bound operation, so fan them out.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        if pyqt6_plugins_path.exists():
+            list(pool.map(_remove_plugin_dir, [pyqt6_plugins_path / d for d in POST_BUILD_CLEANUP_PLUGINS]))
+
+        if pyqt6_bin_path.exists():
+            # One directory read with a substring test per entry instead of a glob per pattern
+            patterns = tuple(POST_BUILD_CLEANUP_DLLS)
+            with os.scandir(pyqt6_bin_path) as it:
+                dll_files = [Path(e.path) for e in it if any(p in e.name for p in patterns)]
+            list(pool.map(_remove_dll, dll_files))
     
     # Determine executable extension and path
     ext = ".exe" if sys.platform == "win32" else ""
-    print(f"Build complete! Executable should be in dist/{app_name}/{app_name}{ext}")
-    print(f"Note: Using --onedir for faster startup. All files are in dist/{app_name}/")
+    print(f"Build complete! Executable should be in dist/{APP_NAME}/{APP_NAME}{ext}")
+    print(f"Note: Using --onedir for faster startup. All files are in dist/{APP_NAME}/")
     print(f"Cleaned up unnecessary PyQt6 plugins and multimedia DLLs.")
 
+def print_build_args():
+    """
+    --dry-run: print the PyInstaller invocation build() would run and a hash of its
+    inputs (usable as a CI cache key) without provisioning the build venv or running
+    PyInstaller. With a spec file the hash covers the spec and build_common.py.
+    """
+    rebuild = "--rebuild" in sys.argv[1:]
+    spec_file = PROJECT_ROOT / f"{APP_NAME}.spec"
+    if spec_file.exists():
+        args = [str(spec_file), "--noconfirm"]
+        if rebuild:
+            args.append("--clean")
+        digest = hashlib.sha256()
+        for path in (spec_file, PROJECT_ROOT / "build_common.py"):
+            digest.update(path.read_bytes())
+        print("pyinstaller " + " ".join(args))
+        print(digest.hexdigest())
+        return
+    args = _build_pyinstaller_args(rebuild)
+    print(" ".join(args))
+    print(hashlib.sha256(json.dumps(args, sort_keys=True).encode()).hexdigest())
+
+
 if __name__ == "__main__":
-    ensure_build_venv()
-    build()
+    if "--dry-run" in sys.argv[1:]:
+        print_build_args()
+    else:
+        ensure_build_venv()
+        build()
 
@@ -0,0 +1,116 @@
+"""PyInstaller settings shared by build.py and floattime.spec."""
+from pathlib import Path
+from typing import Optional
+
+APP_NAME = "floattime"
+
+HIDDEN_IMPORTS = [
+    "config",
+    "ontime_client",
+    "timer_widget",
+    "tray_manager",
+    "logger",
+    "ui.config_dialog",
+    "PyQt6.QtCore",
+    "PyQt6.QtWidgets",
+    "PyQt6.QtGui",
+    "websocket",
+    "websocket_client",
+    "socketio",
+    "engineio",
+]
+
+# Exclude unused modules to reduce size and startup time
+EXCLUDED_MODULES = [
+    "matplotlib",
+    "numpy",
+    "pandas",
+    "scipy",
+    "PIL",
+    "tkinter",
+    "PyQt5",
+    "PySide2",
+    "PySide6",
+    "PyQt6.QtMultimedia",
+    "PyQt6.QtMultimediaWidgets",
+    "PyQt6.QtWebEngineCore",
+    "PyQt6.QtWebEngineWidgets",
+    "PyQt6.QtQuick",
+    "PyQt6.QtQuickWidgets",
+    "PyQt6.QtQml",
+    "PyQt6.QtSql",
+    "PyQt6.QtNetworkAuth",
+    "PyQt6.QtBluetooth",
+    "PyQt6.QtNfc",
+    "PyQt6.QtPositioning",
+    "PyQt6.QtSensors",
+    "PyQt6.QtSerialPort",
+    "PyQt6.QtWebChannel",
+    "PyQt6.QtXml",
+    "PyQt6.QtTest",
+    "PyQt6.QtDesigner",
+    "PyQt6.QtPrintSupport",
+    "PyQt6.QtOpenGL",
+    "PyQt6.QtOpenGLWidgets",
+    "PyQt6.QtPdf",
+    "PyQt6.QtPdfWidgets",
+    # Unused standard library components
+    "unittest",
+    "pydoc",
+    "html",
+    "http.server",
+    "distutils",
+    "setuptools",
+    "lib2to3",
+    "pydoc_data",
+    "xmlrpc",
+    # Compression C extensions (zipfile/tarfile/shutil import them optionally)
+    "bz2",
+    "_bz2",
+    "lzma",
+    "_lzma",
+    # Kept on purpose: _ssl (https:// and wss:// servers), email (http.client),
+    # unicodedata (idna), _hashlib (hashlib for the WebSocket handshake), pyexpat/xml (plistlib on macOS)
+]
+
+# Post-build cleanup: plugin directories to remove (everything except platforms and styles)
+POST_BUILD_CLEANUP_PLUGINS = [
+    'multimedia', 'mediaservice', 'webengine', 'webview', 'quick',
+    'qmltooling', 'sqldrivers', 'geoservices', 'position',
+    'sensorgestures', 'sensors', 'serialbus', 'serialport',
+    'texttospeech', 'assetimporters', 'sceneparsers', 'renderers',
+    'printsupport'
+]
+
+# Post-build cleanup: substrings of DLL names to remove from the Qt bin directory
+POST_BUILD_CLEANUP_DLLS = [
+    # Multimedia/FFmpeg
+    'avcodec', 'avformat', 'avutil', 'swresample', 'swscale', 'ffmpeg',
+    # 3D/Asset importers
+    'assimp', 'gltf',
+    # PDF (we excluded QtPdf modules)
+    'Qt6Pdf',
+    # WebEngine (we excluded QtWebEngine)
+    'Qt6WebEngine', 'Qt6WebEngineCore', 'Qt6WebEngineWidgets',
+    # Quick/QML (we excluded QtQuick/QtQml)
+    'Qt6Quick', 'Qt6Qml', 'Qt6QuickWidgets',
+    # SQL (we excluded QtSql)
+    'Qt6Sql',
+    # Other excluded modules
+    'Qt6Multimedia', 'Qt6Bluetooth', 'Qt6Positioning', 'Qt6Sensors',
+    'Qt6SerialPort', 'Qt6OpenGL', 'Qt6PrintSupport'
+]
+
+
+def strip_binaries(platform: str) -> bool:
+    """Strip debug symbols from bundled .so files on Linux (fewer bytes to page in at
+    cold start). Not on Windows (no-op for PE) or macOS (invalidates code signatures)."""
+    return platform.startswith("linux")
+
+
+def find_icon(root: Path) -> Optional[str]:
+    """Return the app icon file name in root (icon.ico preferred), or None."""
+    for candidate in ("icon.ico", "icon.png"):
+        if (root / candidate).exists():
+            return candidate
+    return None
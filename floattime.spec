@@ -0,0 +1,66 @@
+# -*- mode: python ; coding: utf-8 -*-
+"""PyInstaller spec for FloatTime (same options as the CLI args in build.py).
+
+Run via `python build.py` (incremental) or `python build.py --rebuild` (clean).
+Keeping the spec lets PyInstaller reuse its build/ cache between runs.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, SPECPATH)
+from build_common import APP_NAME, EXCLUDED_MODULES, HIDDEN_IMPORTS, find_icon, strip_binaries
+
+strip = strip_binaries(sys.platform)
+icon = find_icon(Path(SPECPATH))
+icon = [icon] if icon else None
+
+a = Analysis(
+    ["src/main.py"],
+    pathex=["src"],
+    binaries=[],
+    datas=[("src", "src")],
+    hiddenimports=HIDDEN_IMPORTS,
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=EXCLUDED_MODULES,
+    noarchive=False,
+    optimize=2,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,  # --onedir: faster startup than --onefile (no temp extraction)
+    name=APP_NAME,
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=strip,
+    upx=False,  # Disable UPX compression (faster startup)
+    console=False,  # No console window
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=icon,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=strip,
+    upx=False,
+    upx_exclude=[],
+    name=APP_NAME,
+)
+
+if sys.platform == "darwin":
+    app = BUNDLE(
+        coll,
+        name=f"{APP_NAME}.app",
+        icon=icon,
+        bundle_identifier=None,
+    )
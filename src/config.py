@@ -1,21 +1,84 @@
 """Configuration management for FloatTime."""
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Optional, Any, Dict
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+# Prefer orjson for config (de)serialization; fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# JSON codecs, bound once at import: _loads parses bytes, _dumps returns compact JSON bytes
+if ORJSON_AVAILABLE:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode('utf-8')
+
+# Coalesce bursts of setter calls into one disk write after this delay (seconds)
+SAVE_DELAY_S = 0.5
+
+CONFIG_DIR = Path.home() / ".floattime"
+CONFIG_FILE = CONFIG_DIR / "config.json"
+_config_dir_created = False
+
+_DISPLAY_MODES = frozenset(('timer', 'clock'))
+
+def _pair(value: Any) -> Optional[tuple]:
+    """Stored [a, b] list -> (int, int) tuple, or None if missing/malformed."""
+    if value and isinstance(value, list) and len(value) == 2:
+        try:
+            return (int(value[0]), int(value[1]))
+        except (TypeError, ValueError):
+            pass
+    return None
+
+
+# Keys served from plain instance attributes of the same name, so getters skip the
+# dict lookup and validation. Maps key -> normalizer(raw cached value or None).
+_ATTR_KEYS = {
+    'server_url': lambda v: v,
+    'display_mode': lambda v: v if v in _DISPLAY_MODES else 'timer',
+    'background_visible': lambda v: True if v is None else v,
+    'locked': lambda v: False if v is None else v,
+    'addtime_affects_event_duration': lambda v: False if v is None else v,
+    'hover_controls_enabled': lambda v: True if v is None else v,
+    'window_size': _pair,
+    'window_position': _pair,
+}
+
 class Config:
     """Manages application configuration with in-memory caching."""
     
     def __init__(self):
         """Initialize configuration manager."""
-        self.config_dir = Path.home() / ".floattime"
-        self.config_file = self.config_dir / "config.json"
-        self.config_dir.mkdir(exist_ok=True)
+        global _config_dir_created
+        self.config_dir = CONFIG_DIR
+        self.config_file = CONFIG_FILE
+        if not _config_dir_created:
+            self.config_dir.mkdir(exist_ok=True)
+            _config_dir_created = True
         self._cache: Dict[str, Any] = self._load_from_disk()
+        self._load_attrs()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+
+    def _load_attrs(self):
+        """Populate attribute-backed keys from the cache (getters return these directly)."""
+        for key, normalize in _ATTR_KEYS.items():
+            setattr(self, key, normalize(self._cache.get(key)))
     
     def _load_from_disk(self) -> Dict[str, Any]:
         """Load configuration from disk into memory."""
@@ -23,17 +86,18 @@ class Config:
             return {}
         
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            return _loads(self.config_file.read_bytes())
+        except (ValueError, IOError) as e:
             logger.error(f"Failed to load config from disk: {e}")
             return {}
 
     def _save_to_disk(self) -> bool:
         """Write current cached configuration to disk."""
+        # Write to a temp file and swap it in, so a crash mid-write can't corrupt config.json
+        tmp_file = self.config_file.with_suffix(".json.tmp")
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._cache, f, indent=2)
+            tmp_file.write_bytes(_dumps(self._cache))
+            os.replace(tmp_file, self.config_file)
             return True
         except IOError as e:
             logger.error(f"Failed to save config to disk: {e}")
@@ -44,13 +108,37 @@ class Config:
         return self._cache.get(key, default)
 
     def set(self, key: str, value: Any) -> bool:
-        """Set a configuration value in cache and save to disk."""
-        self._cache[key] = value
-        return self._save_to_disk()
+        """Set a configuration value in cache and schedule a save to disk."""
+        return self.set_many({key: value})
+
+    def set_many(self, values: Dict[str, Any]) -> bool:
+        """Set several configuration values as one change (a single scheduled save)."""
+        with self._lock:
+            for key, value in values.items():
+                self._cache[key] = value
+                normalize = _ATTR_KEYS.get(key)
+                if normalize is not None:
+                    setattr(self, key, normalize(value))
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SAVE_DELAY_S, self.flush)
+                self._save_timer.start()
+        return True
+
+    def flush(self) -> bool:
+        """Write pending changes to disk now. Call before the application quits."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return True
+            self._dirty = not self._save_to_disk()
+            return not self._dirty
 
     def get_server_url(self) -> Optional[str]:
         """Get the Ontime server URL from configuration."""
-        return self.get('server_url')
+        return self.server_url
     
     def set_server_url(self, url: str) -> bool:
         """Save the Ontime server URL to configuration."""
@@ -62,18 +150,17 @@ class Config:
     
     def get_display_mode(self) -> str:
         """Get display mode: 'timer' or 'clock'."""
-        mode = self.get('display_mode', 'timer')
-        return mode if mode in ['timer', 'clock'] else 'timer'
+        return self.display_mode
     
     def set_display_mode(self, mode: str) -> bool:
         """Save display mode: 'timer' or 'clock'."""
-        if mode not in ['timer', 'clock']:
+        if mode not in _DISPLAY_MODES:
             return False
         return self.set('display_mode', mode)
     
     def get_background_visible(self) -> bool:
         """Get background visibility setting."""
-        return self.get('background_visible', True)
+        return self.background_visible
     
     def set_background_visible(self, visible: bool) -> bool:
         """Save background visibility setting."""
@@ -81,10 +168,7 @@ class Config:
     
     def get_window_size(self) -> Optional[tuple]:
         """Get saved window size (width, height)."""
-        size = self.get('window_size')
-        if size and isinstance(size, list) and len(size) == 2:
-            return tuple(size)
-        return None
+        return self.window_size
     
     def set_window_size(self, width: int, height: int) -> bool:
         """Save window size."""
@@ -92,18 +176,22 @@ class Config:
 
     def get_window_position(self) -> Optional[tuple]:
         """Get saved window position (x, y)."""
-        pos = self.get('window_position')
-        if pos and isinstance(pos, list) and len(pos) == 2:
-            return (int(pos[0]), int(pos[1]))
-        return None
+        return self.window_position
 
     def set_window_position(self, x: int, y: int) -> bool:
         """Save window position."""
         return self.set('window_position', [int(x), int(y)])
     
+    def set_window_geometry(self, x: int, y: int, width: int, height: int) -> bool:
+        """Save window position and size together."""
+        return self.set_many({
+            'window_position': [int(x), int(y)],
+            'window_size': [int(width), int(height)],
+        })
+    
     def get_locked(self) -> bool:
         """Get locked state (prevents moving and resizing)."""
-        return self.get('locked', False)
+        return self.locked
     
     def set_locked(self, locked: bool) -> bool:
         """Save locked state."""
@@ -111,7 +199,7 @@ class Config:
 
     def get_addtime_affects_event_duration(self) -> bool:
         """Get whether +/- 1 min also changes current event's duration."""
-        return self.get('addtime_affects_event_duration', False)
+        return self.addtime_affects_event_duration
 
     def set_addtime_affects_event_duration(self, value: bool) -> bool:
         """Save whether +/- 1 min also changes current event's duration."""
@@ -119,7 +207,7 @@ class Config:
 
     def get_hover_controls_enabled(self) -> bool:
         """Get whether on-hover control overlays are enabled."""
-        return self.get('hover_controls_enabled', True)
+        return self.hover_controls_enabled
 
     def set_hover_controls_enabled(self, value: bool) -> bool:
         """Save whether on-hover control overlays are enabled."""
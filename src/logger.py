@@ -1,29 +1,41 @@
 """Centralized logging configuration for FloatTime."""
 import logging
 import os
+from typing import Dict
 
 # Flag to enable/disable debug logging
 # Can be overridden by environment variable FLOATTIME_DEBUG
 DEBUG_LOGGING = os.environ.get('FLOATTIME_DEBUG', 'False').lower() == 'true'
 
+# Level applied to the root logger and every named logger (computed once)
+_LEVEL = logging.INFO if DEBUG_LOGGING else logging.WARNING
+
+# True only if logger.debug() records would actually be emitted. Callers can use
+# `if DEBUG_ENABLED: logger.debug(...)` to skip building expensive arguments.
+DEBUG_ENABLED = _LEVEL <= logging.DEBUG
+
+# Loggers already configured by get_logger, keyed by name
+_LOGGER_CACHE: Dict[str, logging.Logger] = {}
+
 def setup_logging():
     """Configure the root logger."""
-    level = logging.INFO if DEBUG_LOGGING else logging.WARNING
-    
     logging.basicConfig(
-        level=level,
+        level=_LEVEL,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%H:%M:%S'
     )
 
 def get_logger(name: str):
     """Get a named logger instance."""
+    logger = _LOGGER_CACHE.get(name)
+    if logger is not None:
+        return logger
     logger = logging.getLogger(name)
     # Ensure the logger respects the global level if not already set
     if not logger.level:
-        logger.setLevel(logging.INFO if DEBUG_LOGGING else logging.WARNING)
+        logger.setLevel(_LEVEL)
+    _LOGGER_CACHE[name] = logger
     return logger
 
 # Initial setup on module import
 setup_logging()
-
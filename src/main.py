@@ -12,7 +12,7 @@ else:
     sys.path.insert(0, str(Path(__file__).parent))
 
 from PyQt6.QtWidgets import QApplication, QMainWindow, QMenu, QDialog
-from PyQt6.QtCore import Qt, QTimer, QObject, pyqtSignal, QPointF, QPoint, QSize, QRect
+from PyQt6.QtCore import Qt, QTimer, QObject, pyqtSignal, pyqtSlot, QPointF, QPoint, QSize, QRect, QThreadPool
 from PyQt6.QtGui import QAction, QKeySequence, QShortcut, QCursor, QGuiApplication
 from logger import get_logger, DEBUG_LOGGING
 
@@ -21,70 +21,109 @@ from config import Config
 from timer_widget import TimerWidget
 from timer_controls import TopControlOverlay, BottomControlOverlay
 from tray_manager import TrayIconManager
+from ontime_client import OntimeClient  # Already loaded by timer_widget
 
 logger = get_logger(__name__)
 
+IS_MAC = sys.platform == "darwin"
+IS_WINDOWS = sys.platform == "win32"
+
 # macOS: NSWindow level constants (Qt's WindowStaysOnTopHint is often ignored)
 NSNormalWindowLevel = 0
 NSFloatingWindowLevel = 3
 NSStatusWindowLevel = 25  # More aggressive "always on top"
 
+# Size (px) of the square hot zone in each window corner that starts a resize
+RESIZE_CORNER_SIZE = 40
+_CORNER_CURSORS = {
+    'top-left': Qt.CursorShape.SizeFDiagCursor,
+    'bottom-right': Qt.CursorShape.SizeFDiagCursor,
+    'top-right': Qt.CursorShape.SizeBDiagCursor,
+    'bottom-left': Qt.CursorShape.SizeBDiagCursor,
+}
+
+# (key sequence, slot name). Explicit strings rather than StandardKey.Quit/Close:
+# those map to nothing / Ctrl+F4 on Windows, and these keys should match everywhere.
+_SHORTCUTS = (
+    ("Ctrl+Q", "quit_application"),
+    ("Ctrl+W", "quit_application"),
+    ("Escape", "hide"),
+)
+
+
+# PyObjC module ref, imported on first use (on the GUI thread; AppKit must not load elsewhere)
+_objc = None
+
+
+def _load_pyobjc():
+    """Import and cache PyObjC for the macOS window level (raises ImportError if missing)."""
+    global _objc
+    if _objc is None:
+        import objc
+        import AppKit  # noqa: F401  # Loads the Cocoa bridge used by nsview.window()
+        _objc = objc
+    return _objc
 
-def _set_macos_window_level(window, floating: bool):
+
+def _preload_modules():
+    """Warm imports that would otherwise stall the GUI thread on first use (runs on a pool thread)."""
+    import ui.config_dialog  # noqa: F401
+
+
+def _set_macos_window_level_impl(window, floating: bool):
     """Set NSWindow level on macOS so the window actually stays on top of other apps.
     
     Requires pyobjc-framework-Cocoa: pip install pyobjc-framework-Cocoa
     """
-    if sys.platform != "darwin":
-        return
     try:
         # Use PyObjC to get NSWindow from NSView pointer
-        import objc
-        from ctypes import c_void_p
-        from AppKit import NSView
+        objc = _load_pyobjc()
         
         qwindow = window.windowHandle()
-        print(f"[macOS] windowHandle = {qwindow}")
+        logger.info("[macOS] windowHandle = %s", qwindow)
         if not qwindow:
-            print("[macOS] ERROR: windowHandle is None")
+            logger.error("[macOS] windowHandle is None")
             return
         
         # winId() returns the NSView* pointer as an integer
         nsview_ptr = int(qwindow.winId())
-        print(f"[macOS] NSView pointer = {hex(nsview_ptr)}")
+        logger.info("[macOS] NSView pointer = %#x", nsview_ptr)
         
         # Convert the pointer to an NSView object using PyObjC
         nsview = objc.objc_object(c_void_p=nsview_ptr)
-        print(f"[macOS] NSView object = {nsview}")
+        logger.info("[macOS] NSView object = %s", nsview)
         
         # Get the NSWindow from the NSView
         nswindow = nsview.window()
-        print(f"[macOS] NSWindow = {nswindow}")
+        logger.info("[macOS] NSWindow = %s", nswindow)
         
         if not nswindow:
-            print("[macOS] ERROR: Could not get NSWindow from NSView")
+            logger.error("[macOS] Could not get NSWindow from NSView")
             return
         
         # Set window level using PyObjC
         level = NSStatusWindowLevel if floating else NSNormalWindowLevel
-        print(f"[macOS] Setting window level to {level} (floating={floating})")
+        logger.info("[macOS] Setting window level to %s (floating=%s)", level, floating)
         nswindow.setLevel_(level)
         nswindow.setHidesOnDeactivate_(False)  # Don't hide when losing focus
-        print(f"[macOS] ✓ Window level set successfully")
+        logger.info("[macOS] Window level set successfully")
         
     except ImportError as e:
-        print(f"[macOS] PyObjC not available: {e}")
-        print("[macOS] Install with: pip install pyobjc-framework-Cocoa")
-        print("[macOS] Falling back to Qt's WindowStaysOnTopHint (may not work across apps)")
-    except Exception as e:
-        print(f"[macOS] ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.warning(
+            "[macOS] PyObjC not available (%s). Install with: pip install pyobjc-framework-Cocoa. "
+            "Falling back to Qt's WindowStaysOnTopHint (may not work across apps)", e
+        )
+    except Exception:
+        logger.exception("[macOS] Failed to set window level")
+
+
+# No-op everywhere but macOS (resolved once at import)
+_set_macos_window_level = _set_macos_window_level_impl if IS_MAC else (lambda window, floating: None)
 
 
 def _set_windows_no_activate(window):
     """Set WS_EX_NOACTIVATE on Windows so clicking the overlay does not steal focus from other apps."""
-    if sys.platform != "win32":
+    if not IS_WINDOWS:
         return
     try:
         import ctypes
@@ -123,26 +162,35 @@ class FloatTimeWindow(QMainWindow):
         self.config = Config()
         self.client = None
         self.timer_signal = TimerUpdateSignal()
-        self.timer_signal.timer_updated.connect(self.on_timer_update)
+        # Bind the (object) overload explicitly so it isn't resolved at connect time.
+        # Emitted from the client's WebSocket thread, so always queue onto the GUI thread
+        # (explicit, instead of AutoConnection's per-emit thread check).
+        self.timer_signal.timer_updated[object].connect(
+            self.on_timer_update, Qt.ConnectionType.QueuedConnection
+        )
         
         self.is_locked = self.config.get_locked()
-        self._updating_fonts = False
         self._blink_on = False
         self._blackout_on = False
         self._screen_changed_connected = False
+        self._always_on_top = True  # Mirrors WindowStaysOnTopHint (set in setup_ui)
+        self._config_dialog = None  # Built on first use, then reused
         
         # Debounce timer for resize events (smoother resizing)
         self._resize_timer = QTimer(self)
         self._resize_timer.setSingleShot(True)
         self._resize_timer.timeout.connect(self._apply_font_resize)
         self._pending_resize = None
+        self._last_applied_size = (0, 0)
         
         # Drag/resize state (set in mousePressEvent; must exist if move arrives before press)
         self.resize_corner = None
         self._drag_or_resize_started = False
+        self._invalidate_drag_screen()
         self.initial_pos = QPoint(0, 0)
         self.initial_win_pos = QPoint(0, 0)
         self.initial_size = QSize(0, 0)
+        self._current_cursor_shape = Qt.CursorShape.ArrowCursor
         
         self.setup_ui()
         self.tray_manager = TrayIconManager(self)
@@ -165,6 +213,7 @@ class FloatTimeWindow(QMainWindow):
         self.setMinimumSize(150, 100)
         size = self.config.get_window_size() or (300, 150)
         self.resize(*size)
+        self._recompute_corner_rects()
         self._restore_window_position()
         
         self.setMouseTracking(True)
@@ -173,6 +222,7 @@ class FloatTimeWindow(QMainWindow):
         
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
+        self._build_context_menu()
 
         # On-hover timer control overlays (top and bottom)
         self.top_overlay = TopControlOverlay(self)
@@ -183,128 +233,124 @@ class FloatTimeWindow(QMainWindow):
         self._overlay_hide_timer = QTimer(self)
         self._overlay_hide_timer.setSingleShot(True)
         self._overlay_hide_timer.timeout.connect(self._hide_controls_overlays)
+        self._cache_overlay_hints()
         self._connect_control_overlays()
 
+        app = QGuiApplication.instance()
+        if app is not None:
+            app.screenAdded.connect(self._invalidate_drag_screen)
+            app.screenRemoved.connect(self._invalidate_drag_screen)
+
     def _connect_control_overlays(self):
-        """Connect overlay buttons to Ontime client control API."""
-        def do_start():
-            if self.client:
-                self.client.start_timer()
-        def do_pause():
-            if self.client:
-                self.client.pause_timer()
-        def do_reload():
-            if self.client:
-                self.client.reload_timer()
-        def do_add_minute():
-            if self.client:
-                if self.config.get_addtime_affects_event_duration():
-                    self.client.change_current_event_duration(60000)
-                else:
-                    self.client.add_time_ms(60000)
-        def do_remove_minute():
-            if self.client:
-                if self.config.get_addtime_affects_event_duration():
-                    self.client.change_current_event_duration(-60000)
-                else:
-                    self.client.remove_time_ms(60000)
-        def do_previous_event():
-            if self.client and self.client.last_timer_data and self.client.last_timer_data.has_previous_event:
-                self.client.load_previous_event()
-        def do_next_event():
-            if self.client and self.client.last_timer_data and self.client.last_timer_data.has_next_event:
-                self.client.load_next_event()
-        
+        """Connect overlay buttons directly to the timer control slots."""
         # Connect bottom overlay
-        self.bottom_overlay.start_clicked.connect(do_start)
-        self.bottom_overlay.pause_clicked.connect(do_pause)
-        self.bottom_overlay.restart_clicked.connect(do_reload)
-        self.bottom_overlay.previous_clicked.connect(do_previous_event)
-        self.bottom_overlay.next_clicked.connect(do_next_event)
+        self.bottom_overlay.start_clicked.connect(self.timer_control_start)
+        self.bottom_overlay.pause_clicked.connect(self.timer_control_pause)
+        self.bottom_overlay.restart_clicked.connect(self.timer_control_reload)
+        self.bottom_overlay.previous_clicked.connect(self.timer_control_previous_event)
+        self.bottom_overlay.next_clicked.connect(self.timer_control_next_event)
         
         # Connect top overlay
-        self.top_overlay.remove_minute_clicked.connect(do_remove_minute)
-        self.top_overlay.add_minute_clicked.connect(do_add_minute)
+        self.top_overlay.remove_minute_clicked.connect(self.timer_control_remove_minute)
+        self.top_overlay.add_minute_clicked.connect(self.timer_control_add_minute)
 
     def _hide_controls_overlays(self):
         """Hide both control overlays."""
         self.top_overlay.hide()
         self.bottom_overlay.hide()
 
+    def _cache_overlay_hints(self):
+        """Snapshot overlay size hints (fixed-content bars; refreshed on screen/DPR change)."""
+        self._top_hint = self.top_overlay.sizeHint()
+        self._bottom_hint = self.bottom_overlay.sizeHint()
+        self._overlays_dirty = True
+
     def _position_control_overlays(self):
         """Position overlays: +1/-1 at top, play/pause/restart at bottom, both centered."""
         w, h = self.width(), self.height()
         
         # Top overlay (+1, -1) - centered at top edge
-        top_w = self.top_overlay.sizeHint().width()
-        top_h = self.top_overlay.sizeHint().height()
+        top_w, top_h = self._top_hint.width(), self._top_hint.height()
         self.top_overlay.setGeometry((w - top_w) // 2, 4, top_w, top_h)
         
         # Bottom overlay (play, pause, restart) - centered at bottom edge
-        bottom_w = self.bottom_overlay.sizeHint().width()
-        bottom_h = self.bottom_overlay.sizeHint().height()
+        bottom_w, bottom_h = self._bottom_hint.width(), self._bottom_hint.height()
         self.bottom_overlay.setGeometry((w - bottom_w) // 2, h - bottom_h - 4, bottom_w, bottom_h)
+        self._overlays_dirty = False
 
     def setup_shortcuts(self):
-        for key, func in [("Ctrl+Q", self.quit_application), ("Ctrl+W", self.quit_application), ("Escape", self.hide)]:
-            QShortcut(QKeySequence(key), self).activated.connect(func)
+        for key, name in _SHORTCUTS:
+            QShortcut(QKeySequence(key), self).activated.connect(getattr(self, name))
+
+    def _build_context_menu(self):
+        """Build the context menu and its QActions once; show_context_menu only refreshes check states."""
+        # (key, text, slot, checkable); None = separator, "timer" = Timer submenu
+        timer_layout = (
+            ("start", "Start", self.timer_control_start, False),
+            ("pause", "Pause", self.timer_control_pause, False),
+            ("restart", "Restart", self.timer_control_reload, False),
+            ("previous_event", "Previous event", self.timer_control_previous_event, False),
+            ("next_event", "Next event", self.timer_control_next_event, False),
+            ("add_minute", "+1 min", self.timer_control_add_minute, False),
+            ("remove_minute", "-1 min", self.timer_control_remove_minute, False),
+            ("blink", "Blink", self.timer_control_blink, True),
+            ("blackout", "Blackout", self.timer_control_blackout, True),
+        )
+        menu_layout = (
+            ("configure", "Configure...", self.show_config_dialog, False),
+            None,
+            ("hide", "Hide", self.hide, False),
+            ("always_on_top", "Always on Top", self.toggle_always_on_top, True),
+            ("background", "Show Background", self.toggle_background, True),
+            ("locked", "Lock in Place", self.toggle_locked, True),
+            ("hover_controls", "On-hover controls", self.toggle_hover_controls, True),
+            None,
+            ("display_mode", "Show Clock", self.toggle_display_mode, True),
+            ("addtime_affects_duration", "+/- 1 changes event length", self.toggle_addtime_affects_event_duration, True),
+            None,
+            "timer",
+            None,
+            ("reset_size", "Reset Size", self.reset_window_size, False),
+            None,
+            ("quit", "Quit", self.quit_application, False),
+        )
+        self._actions = {}
+        self._context_menu = QMenu(self)
+        timer_menu = QMenu("Timer", self._context_menu)
+
+        def populate(menu, layout):
+            for item in layout:
+                if item is None:
+                    menu.addSeparator()
+                elif item == "timer":
+                    menu.addMenu(timer_menu)
+                else:
+                    key, text, slot, checkable = item
+                    action = QAction(text, self)
+                    action.setCheckable(checkable)
+                    action.triggered.connect(slot)
+                    menu.addAction(action)
+                    self._actions[key] = action
+
+        populate(timer_menu, timer_layout)
+        populate(self._context_menu, menu_layout)
 
     def show_context_menu(self, pos):
-        menu = QMenu(self)
-        
-        # Re-use logic from tray manager or define standard actions
-        actions = [
-            ("Configure...", self.show_config_dialog),
-            (None, None), # Separator
-            ("Hide", self.hide),
-            ("Always on Top", self.toggle_always_on_top, True, bool(self.windowFlags() & Qt.WindowType.WindowStaysOnTopHint)),
-            ("Show Background", self.toggle_background, True, self.timer_widget.background_visible),
-            ("Lock in Place", self.toggle_locked, True, self.is_locked),
-            ("On-hover controls", self.toggle_hover_controls, True, self.config.get_hover_controls_enabled()),
-            (None, None),
-            ("Show Clock" if self.timer_widget.display_mode == 'timer' else "Show Timer", self.toggle_display_mode, True, self.timer_widget.display_mode == 'clock'),
-            ("+/- 1 changes event length", self.toggle_addtime_affects_event_duration, True, self.config.get_addtime_affects_event_duration()),
-            (None, None),
-            ("Reset Size", self.reset_window_size),
-            (None, None),
-            ("Quit", self.quit_application)
-        ]
-        
-        for text, func, *extra in actions:
-            if text is None:
-                menu.addSeparator()
-            else:
-                action = QAction(text, self)
-                if extra:
-                    action.setCheckable(extra[0])
-                    action.setChecked(extra[1])
-                action.triggered.connect(func)
-                if text == "Reset Size":
-                    # Insert Timer submenu before Reset Size
-                    timer_menu = QMenu("Timer", self)
-                    for item in [
-                        ("Start", self.timer_control_start),
-                        ("Pause", self.timer_control_pause),
-                        ("Restart", self.timer_control_reload),
-                        ("Previous event", self.timer_control_previous_event),
-                        ("Next event", self.timer_control_next_event),
-                        ("+1 min", self.timer_control_add_minute),
-                        ("-1 min", self.timer_control_remove_minute),
-                        ("Blink", self.timer_control_blink, True, lambda: self._blink_on),
-                        ("Blackout", self.timer_control_blackout, True, lambda: self._blackout_on),
-                    ]:
-                        label, fn = item[0], item[1]
-                        a = QAction(label, self)
-                        a.triggered.connect(fn)
-                        if len(item) >= 4 and item[2]:
-                            a.setCheckable(True)
-                            a.setChecked(item[3]() if callable(item[3]) else item[3])
-                        timer_menu.addAction(a)
-                    menu.addMenu(timer_menu)
-                    menu.addSeparator()
-                menu.addAction(action)
-        
-        menu.exec(self.mapToGlobal(pos))
+        is_clock = self.timer_widget.display_mode == 'clock'
+        actions = self._actions
+        for key, checked in (
+            ("always_on_top", self._always_on_top),
+            ("background", self.timer_widget.background_visible),
+            ("locked", self.is_locked),
+            ("hover_controls", self.config.get_hover_controls_enabled()),
+            ("display_mode", is_clock),
+            ("addtime_affects_duration", self.config.get_addtime_affects_event_duration()),
+            ("blink", self._blink_on),
+            ("blackout", self._blackout_on),
+        ):
+            actions[key].setChecked(checked)
+        actions["display_mode"].setText("Show Timer" if is_clock else "Show Clock")
+        self._context_menu.exec(self.mapToGlobal(pos))
 
     def load_configuration(self):
         url = self.config.get_server_url()
@@ -315,86 +361,107 @@ class FloatTimeWindow(QMainWindow):
 
     def start_client(self, url: str):
         if self.client: self.client.stop()
-        from ontime_client import OntimeClient
         self.client = OntimeClient(url, update_callback=self.timer_signal.timer_updated.emit)
         self.client.start()
 
     def on_timer_update(self, data):
-        self._blink_on = data.blink
-        self._blackout_on = data.blackout
-        self.tray_manager.update_menu_states()
+        # Updates arrive many times a second; only touch the tray menu when its state flips
+        if data.blink != self._blink_on or data.blackout != self._blackout_on:
+            self._blink_on = data.blink
+            self._blackout_on = data.blackout
+            self.tray_manager.update_menu_states()
         self.timer_widget.update_timer(data)
 
+    @pyqtSlot()
     def show_config_dialog(self):
-        from ui.config_dialog import ConfigDialog
         curr_url = self.config.get_server_url() or self.config.get_default_url()
-        dialog = ConfigDialog(curr_url, self)
+        dialog = self._config_dialog
+        if dialog is None:
+            from ui.config_dialog import ConfigDialog
+            dialog = self._config_dialog = ConfigDialog(curr_url, self)
+        else:
+            dialog.set_url(curr_url)
         if dialog.exec() == QDialog.DialogCode.Accepted and dialog.result_url:
             self.config.set_server_url(dialog.result_url)
             self.start_client(dialog.result_url)
 
+    @pyqtSlot()
     def toggle_display_mode(self):
         new_mode = 'clock' if self.timer_widget.display_mode == 'timer' else 'timer'
         self.timer_widget.set_display_mode(new_mode)
         self.config.set_display_mode(new_mode)
         self.tray_manager.update_menu_states()
 
+    @pyqtSlot()
     def toggle_background(self):
         visible = not self.timer_widget.background_visible
         self.timer_widget.set_background_visible(visible)
         self.config.set_background_visible(visible)
         self.tray_manager.update_menu_states()
 
+    @pyqtSlot()
     def toggle_locked(self):
         self.is_locked = not self.is_locked
         self.config.set_locked(self.is_locked)
         self.tray_manager.update_menu_states()
-        if not self.is_locked: self.setCursor(Qt.CursorShape.ArrowCursor)
+        if not self.is_locked: self._set_cursor_shape(Qt.CursorShape.ArrowCursor)
 
+    @pyqtSlot()
     def toggle_always_on_top(self):
-        if self.windowFlags() & Qt.WindowType.WindowStaysOnTopHint:
-            self.setWindowFlags(self.windowFlags() & ~Qt.WindowType.WindowStaysOnTopHint)
+        self._always_on_top = not self._always_on_top
+        if IS_MAC:
+            # The NSWindow level does the real work on macOS; skip Qt's native window re-creation
+            _set_macos_window_level(self, self._always_on_top)
         else:
-            self.setWindowFlags(self.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-        self.show()
+            self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, self._always_on_top)
+            self.show()  # Changing window flags hides the window
         self.tray_manager.update_menu_states()
 
+    @pyqtSlot()
     def reset_window_size(self):
         self.resize(300, 150)
         self.config.set_window_size(300, 150)
 
+    @pyqtSlot()
     def timer_control_start(self):
         if self.client:
             self.client.start_timer()
 
+    @pyqtSlot()
     def timer_control_pause(self):
         if self.client:
             self.client.pause_timer()
 
+    @pyqtSlot()
     def timer_control_reload(self):
         if self.client:
             self.client.reload_timer()
 
+    @pyqtSlot()
     def timer_control_previous_event(self):
         if self.client and self.client.last_timer_data and self.client.last_timer_data.has_previous_event:
             self.client.load_previous_event()
 
+    @pyqtSlot()
     def timer_control_next_event(self):
         if self.client and self.client.last_timer_data and self.client.last_timer_data.has_next_event:
             self.client.load_next_event()
 
+    @pyqtSlot()
     def timer_control_blink(self):
         self._blink_on = not self._blink_on
         if self.client:
             self.client.set_timer_blink(self._blink_on)
         self.tray_manager.update_menu_states()
 
+    @pyqtSlot()
     def timer_control_blackout(self):
         self._blackout_on = not self._blackout_on
         if self.client:
             self.client.set_timer_blackout(self._blackout_on)
         self.tray_manager.update_menu_states()
 
+    @pyqtSlot()
     def timer_control_add_minute(self):
         if self.client:
             if self.config.get_addtime_affects_event_duration():
@@ -402,6 +469,7 @@ class FloatTimeWindow(QMainWindow):
             else:
                 self.client.add_time_ms(60000)
 
+    @pyqtSlot()
     def timer_control_remove_minute(self):
         if self.client:
             if self.config.get_addtime_affects_event_duration():
@@ -409,11 +477,13 @@ class FloatTimeWindow(QMainWindow):
             else:
                 self.client.remove_time_ms(60000)
 
+    @pyqtSlot()
     def toggle_addtime_affects_event_duration(self):
         value = not self.config.get_addtime_affects_event_duration()
         self.config.set_addtime_affects_event_duration(value)
         self.tray_manager.update_menu_states()
 
+    @pyqtSlot()
     def toggle_hover_controls(self):
         value = not self.config.get_hover_controls_enabled()
         self.config.set_hover_controls_enabled(value)
@@ -421,42 +491,74 @@ class FloatTimeWindow(QMainWindow):
             self._hide_controls_overlays()
         self.tray_manager.update_menu_states()
 
+    @pyqtSlot()
     def show_window(self):
         self.show()
         self.raise_()
         self.activateWindow()
 
+    @pyqtSlot()
     def quit_application(self):
         if self.client: self.client.stop()
+        self.config.flush()
         QApplication.quit()
 
     # --- Mouse handling for Drag/Resize ---
+    def _recompute_corner_rects(self):
+        """Cache the four resize hot-zone rects for the current window size."""
+        w, h, sz = self.width(), self.height(), RESIZE_CORNER_SIZE
+        # +1: the zones include the pixel at distance sz from the edge
+        self._corner_rects = (
+            ('top-left', QRect(0, 0, sz + 1, sz + 1)),
+            ('top-right', QRect(w - sz, 0, sz + 1, sz + 1)),
+            ('bottom-left', QRect(0, h - sz, sz + 1, sz + 1)),
+            ('bottom-right', QRect(w - sz, h - sz, sz + 1, sz + 1)),
+        )
+
     def _get_resize_corner(self, pos):
-        w, h, sz = self.width(), self.height(), 40
-        if pos.x() <= sz and pos.y() <= sz: return 'top-left'
-        if pos.x() >= w - sz and pos.y() <= sz: return 'top-right'
-        if pos.x() <= sz and pos.y() >= h - sz: return 'bottom-left'
-        if pos.x() >= w - sz and pos.y() >= h - sz: return 'bottom-right'
+        for name, rect in self._corner_rects:
+            if rect.contains(pos):
+                return name
         return None
 
     def _get_cursor(self, corner):
-        if corner in ['top-left', 'bottom-right']: return Qt.CursorShape.SizeFDiagCursor
-        if corner in ['top-right', 'bottom-left']: return Qt.CursorShape.SizeBDiagCursor
-        return Qt.CursorShape.ArrowCursor
+        return _CORNER_CURSORS.get(corner, Qt.CursorShape.ArrowCursor)
+
+    def _set_cursor_shape(self, shape):
+        """setCursor only when the shape actually changes (mouse moves fire constantly)."""
+        if shape != self._current_cursor_shape:
+            self.setCursor(shape)
+            self._current_cursor_shape = shape
 
     def _clamp_to_screen(self, pos: QPoint, size: QSize) -> QPoint:
         """Clamp window position so the window stays within the available screen geometry."""
-        screen = QGuiApplication.screenAt(pos)
-        if screen is None:
-            screen = self.screen() or QGuiApplication.primaryScreen()
-        if screen is None:
-            return pos
-        available = screen.availableGeometry()
+        # During a drag the target screen rarely changes: reuse it while it still contains pos
+        if self._drag_screen is not None and self._drag_screen_geometry.contains(pos):
+            available = self._drag_avail
+        else:
+            screen = QGuiApplication.screenAt(pos)
+            if screen is None:
+                screen = self.screen() or QGuiApplication.primaryScreen()
+            if screen is None:
+                return pos
+            available = screen.availableGeometry()
+            if self._drag_or_resize_started:
+                self._cache_drag_screen(screen)
         w, h = size.width(), size.height()
         x = max(available.left(), min(pos.x(), available.right() - w))
         y = max(available.top(), min(pos.y(), available.bottom() - h))
         return QPoint(x, y)
 
+    def _cache_drag_screen(self, screen):
+        """Remember the screen (and its geometries) the current drag/resize is on."""
+        self._drag_screen = screen
+        self._drag_screen_geometry = screen.geometry() if screen else QRect()
+        self._drag_avail = screen.availableGeometry() if screen else QRect()
+
+    def _invalidate_drag_screen(self, *args):
+        """Drop the cached drag screen (monitor added/removed or drag finished)."""
+        self._cache_drag_screen(None)
+
     def _position_in_available_geometry(self, x: int, y: int, w: int, h: int) -> bool:
         """Return True if the rectangle (x, y, w, h) fits within at least one screen's available geometry."""
         for screen in QGuiApplication.screens():
@@ -494,12 +596,16 @@ class FloatTimeWindow(QMainWindow):
         self.initial_pos = event.globalPosition().toPoint()
         self.initial_win_pos = self.pos()
         self.initial_size = self.size()
+        self._cache_drag_screen(self.screen() or QGuiApplication.primaryScreen())
         self._drag_or_resize_started = True
 
     def mouseMoveEvent(self, event):
-        pos = event.position().toPoint()
-        corner = self._get_resize_corner(pos)
-        self.setCursor(self._get_cursor(corner) if corner else Qt.CursorShape.ArrowCursor)
+        if self._drag_or_resize_started:
+            # The corner is fixed for the whole drag/resize: skip the hit-test on every move
+            corner = self.resize_corner
+        else:
+            corner = self._get_resize_corner(event.position().toPoint())
+        self._set_cursor_shape(self._get_cursor(corner))
         
         if self.is_locked or not (event.buttons() & Qt.MouseButton.LeftButton): return
         if not self._drag_or_resize_started:
@@ -532,35 +638,43 @@ class FloatTimeWindow(QMainWindow):
             self.move(clamped)
 
     def mouseReleaseEvent(self, event):
-        self.config.set_window_size(self.width(), self.height())
-        self.config.set_window_position(self.x(), self.y())
+        self.config.set_window_geometry(self.x(), self.y(), self.width(), self.height())
         self.resize_corner = None
         self._drag_or_resize_started = False
+        self._invalidate_drag_screen()
 
     def _apply_font_resize(self):
         """Apply the pending font size update."""
-        if self._pending_resize and not self._updating_fonts:
-            self._updating_fonts = True
+        if self._pending_resize:
             w, h = self._pending_resize
-            self.timer_widget.update_font_sizes(w, h)
-            self._updating_fonts = False
+            self.timer_widget.update_font_sizes_async(w, h)
+            self._last_applied_size = self._pending_resize
             self._pending_resize = None
     
     def resizeEvent(self, event):
-        # Debounce font updates for smoother resize
-        self._pending_resize = (self.width(), self.height())
-        self._resize_timer.start(10)  # 10ms debounce
+        self._recompute_corner_rects()
+        size = (self.width(), self.height())
+        if size != self._last_applied_size:
+            # Debounce font updates for smoother resize
+            self._pending_resize = size
+            self._resize_timer.start(33)  # ~one frame at 30 Hz
+        else:
+            # Back at the applied size: drop any pending update for an intermediate size
+            self._resize_timer.stop()
+            self._pending_resize = None
         
-        # Always reposition overlays immediately
-        self._position_control_overlays()
+        # Reposition overlays immediately while shown; otherwise defer to enterEvent
+        if self.top_overlay.isVisible():
+            self._position_control_overlays()
+        else:
+            self._overlays_dirty = True
         super().resizeEvent(event)
 
     def showEvent(self, event):
         super().showEvent(event)
-        if sys.platform == "darwin":
-            on_top = bool(self.windowFlags() & Qt.WindowType.WindowStaysOnTopHint)
-            _set_macos_window_level(self, on_top)
-        if sys.platform == "win32":
+        if IS_MAC:
+            _set_macos_window_level(self, self._always_on_top)
+        if IS_WINDOWS:
             _set_windows_no_activate(self)
         # React to HiDPI / screen changes when window moves between monitors
         wh = self.windowHandle()
@@ -576,16 +690,16 @@ class FloatTimeWindow(QMainWindow):
 
     def _refresh_after_screen_change(self):
         """Update fonts and overlay positions after screen/DPR change."""
+        self._cache_overlay_hints()
         self._position_control_overlays()
-        if not self._updating_fonts:
-            self._updating_fonts = True
-            self.timer_widget.update_font_sizes(self.width(), self.height())
-            self._updating_fonts = False
+        self.timer_widget.update_font_sizes(self.width(), self.height())
 
     def enterEvent(self, event):
         self._overlay_hide_timer.stop()
-        if self.config.get_hover_controls_enabled():
-            self._position_control_overlays()
+        # Only do show work on a genuine enter (overlays hidden), not on child-crossing re-enters
+        if self.config.get_hover_controls_enabled() and not self.top_overlay.isVisible():
+            if self._overlays_dirty:
+                self._position_control_overlays()
             self.top_overlay.show()
             self.top_overlay.raise_()
             self.bottom_overlay.show()
@@ -593,7 +707,8 @@ class FloatTimeWindow(QMainWindow):
         super().enterEvent(event)
 
     def leaveEvent(self, event):
-        self._overlay_hide_timer.start(300)
+        if self.top_overlay.isVisible():
+            self._overlay_hide_timer.start(300)
         super().leaveEvent(event)
 
     def mouseDoubleClickEvent(self, event):
@@ -613,6 +728,7 @@ def main():
         QApplication.setAttribute(attr.AA_UseHighDpiPixmaps, True)
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
+    QThreadPool.globalInstance().start(_preload_modules)
     window = FloatTimeWindow()
     window.show()
     sys.exit(app.exec())
@@ -1,9 +1,12 @@
 """Client for communicating with Ontime API."""
-import requests
 import json
+import socket
+import sys
 from typing import Optional, Dict, Any, Callable
-from threading import Thread, Event, Lock
-from dataclasses import dataclass, field, replace
+from collections import deque
+from threading import Thread, Event
+from urllib.parse import urlsplit
+from dataclasses import dataclass, replace
 from logger import get_logger
 
 logger = get_logger(__name__)
@@ -22,9 +25,66 @@ try:
 except ImportError:
     WEBSOCKET_AVAILABLE = False
 
-@dataclass
+# Prefer orjson for WebSocket frames (parsed on every tick); fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Frame codecs, bound once at import: _loads parses a str/bytes frame, _dumps returns a text frame
+if ORJSON_AVAILABLE:
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
+# Delay before reconnecting a dropped WebSocket, doubled per failed attempt (seconds)
+RECONNECT_MIN_S = 0.5
+RECONNECT_MAX_S = 30.0
+
+# Constant control messages, serialized once
+_MSG_POLL = _dumps({"tag": "poll"})
+_MSG_START = _dumps({"tag": "start"})
+_MSG_PAUSE = _dumps({"tag": "pause"})
+_MSG_RELOAD = _dumps({"tag": "reload"})
+_MSG_LOAD_NEXT = _dumps({"tag": "load", "payload": "next"})
+_MSG_LOAD_PREVIOUS = _dumps({"tag": "load", "payload": "previous"})
+_MSG_BLINK = {on: _dumps({"tag": "message", "payload": {"timer": {"blink": on}}}) for on in (False, True)}
+_MSG_BLACKOUT = {on: _dumps({"tag": "message", "payload": {"timer": {"blackout": on}}}) for on in (False, True)}
+
+# Ontime timer types ("count-down", "count_up", "time-to-end", ...) normalized to
+# space-separated lowercase; the set is small and closed, so cache per raw value
+_DASH_UNDER_TO_SPACE = str.maketrans('-_', '  ')
+_TYPE_CACHE: Dict[str, str] = {}
+_TYPE_CACHE_MAX = 32
+
+# Keys probed (top level first, then timer dict) when the timer type gives no value
+_FALLBACK_TIMER_KEYS = ('timer', 'currentTime', 'time', 'elapsed', 'remaining', 'current')
+_MISSING = object()
+
+# A payload with a clock but none of these keys is a heartbeat and carries nothing to display
+_HEARTBEAT_KEYS = frozenset(('timer', 'eventNow', 'currentEvent'))
+
+
+def _normalize_timer_type(raw: str) -> str:
+    norm = _TYPE_CACHE.get(raw)
+    if norm is None:
+        norm = raw.lower().translate(_DASH_UNDER_TO_SPACE).strip()
+        if len(_TYPE_CACHE) < _TYPE_CACHE_MAX:
+            _TYPE_CACHE[raw] = norm
+    return norm
+
+# Slotted dataclasses need Python 3.10+; on 3.9 TimerData keeps a regular __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class TimerData:
-    """Structured timer data for FloatTime."""
+    """Structured timer data for FloatTime (immutable, comparable and hashable)."""
     timer_ms: Optional[float] = None
     timer_type: str = 'count down'
     title: str = ""
@@ -38,8 +98,6 @@ class TimerData:
     duration: Optional[float] = None
     blink: bool = False
     blackout: bool = False
-    timer_dict: Dict[str, Any] = field(default_factory=dict)
-    raw_data: Dict[str, Any] = field(default_factory=dict)
 
 class OntimeClient:
     """Client for fetching and parsing timer data from Ontime server."""
@@ -53,6 +111,7 @@ class OntimeClient:
         self.ws = None
         self.stop_event = Event()
         self.last_timer_data: Optional[TimerData] = None
+        self._last_message = None
         self.last_known_timer_type: Optional[str] = None
         self.last_current_event_id: Optional[str] = None
         self.last_current_event_duration: Optional[float] = None
@@ -66,31 +125,39 @@ class OntimeClient:
         self.cached_has_previous_event: bool = False
         self.use_websocket = use_websocket and (SOCKETIO_AVAILABLE or WEBSOCKET_AVAILABLE)
         self.websocket_connected = False
-        self._ws_send_lock = Lock()
+        # Control messages are queued by the GUI thread and sent by a writer thread,
+        # so a slow socket write never blocks the UI. Items are (text, on_failure).
+        self._send_queue: deque = deque()
+        self._send_wake = Event()
+        self.writer_thread = None
     
     def _parse_data(self, raw_data: Dict[str, Any]) -> Optional[TimerData]:
         """Unified parser for Ontime API responses."""
-        if not isinstance(raw_data, dict):
+        # Parsed JSON is always a plain dict, so exact type checks suffice (cheaper than isinstance)
+        if type(raw_data) is not dict:
             return None
 
         # Extract nested structures (use `or {}` to handle explicit null values)
-        timer_dict = raw_data.get('timer')
-        if not isinstance(timer_dict, dict):
+        rd_get = raw_data.get
+        timer_dict = rd_get('timer')
+        if type(timer_dict) is not dict:
             timer_dict = {'current': timer_dict} if timer_dict is not None else {}
+        td_get = timer_dict.get
             
         # current_event: from eventNow/currentEvent, or payload may be the event itself (granular update)
-        current_event = raw_data.get('eventNow') or raw_data.get('currentEvent') or {}
-        if not current_event and isinstance(raw_data.get('payload'), dict):
+        current_event = rd_get('eventNow') or rd_get('currentEvent') or {}
+        if not current_event and type(rd_get('payload')) is dict:
             pl = raw_data['payload']
             if pl.get('id') is not None and (pl.get('duration') is not None or pl.get('title') is not None):
                 current_event = pl
-        if not current_event and raw_data.get('id') is not None and (raw_data.get('duration') is not None or raw_data.get('title') is not None):
+        if not current_event and rd_get('id') is not None and (rd_get('duration') is not None or rd_get('title') is not None):
             current_event = raw_data  # payload was the event object directly
-        next_event = raw_data.get('eventNext') or raw_data.get('nextEvent') or {}
+        ce_get = current_event.get
+        next_event = rd_get('eventNext') or rd_get('nextEvent') or {}
         
         # Check if we're in idle state (no event loaded)
-        playback = timer_dict.get('playback', '')
-        no_event_loaded = not current_event or (not current_event.get('id') and not current_event.get('title'))
+        playback = td_get('playback', '')
+        no_event_loaded = not current_event or (not ce_get('id') and not ce_get('title'))
         is_idle = playback == 'idle' or (no_event_loaded and playback in ('', 'stop'))
         
         # Determine timer type
@@ -98,16 +165,16 @@ class OntimeClient:
             timer_type = 'none'
         else:
             timer_type = (
-                raw_data.get('timerType') or 
-                current_event.get('timerType') or 
-                timer_dict.get('timerType') or 
-                timer_dict.get('type') or 
-                timer_dict.get('mode') or
+                rd_get('timerType') or 
+                ce_get('timerType') or 
+                td_get('timerType') or 
+                td_get('type') or 
+                td_get('mode') or
                 self.last_known_timer_type or
                 'count down'
             )
         if isinstance(timer_type, str):
-            timer_type = timer_type.lower().replace('-', ' ').replace('_', ' ').strip()
+            timer_type = _normalize_timer_type(timer_type)
         if timer_type != 'none':
             self.last_known_timer_type = timer_type
 
@@ -116,24 +183,25 @@ class OntimeClient:
         has_timer_data = False
         
         if timer_type == 'count up':
-            timer_ms = timer_dict.get('elapsed')
+            timer_ms = td_get('elapsed')
             if timer_ms is not None: has_timer_data = True
         elif timer_type == 'count down':
-            timer_ms = timer_dict.get('current') or timer_dict.get('remaining')
+            timer_ms = td_get('current') or td_get('remaining')
             if timer_ms is not None: has_timer_data = True
         
         if timer_ms is None:
             # Fallback to general keys
-            for key in ['timer', 'currentTime', 'time', 'elapsed', 'remaining', 'current']:
-                val = raw_data.get(key) if key in raw_data else timer_dict.get(key)
+            for key in _FALLBACK_TIMER_KEYS:
+                val = rd_get(key, _MISSING)
+                if val is _MISSING:
+                    val = td_get(key)
                 if isinstance(val, (int, float)):
                     timer_ms = val
                     has_timer_data = True
                     break
 
         # If this is just a clock heartbeat (no timer data, no title/event change), ignore it
-        is_heartbeat = not has_timer_data and not raw_data.get('timer') and not raw_data.get('eventNow') and not raw_data.get('currentEvent')
-        if is_heartbeat and 'clock' in raw_data:
+        if not has_timer_data and 'clock' in raw_data and _HEARTBEAT_KEYS.isdisjoint(raw_data):
             return None
 
         # Next/previous event detection - use rundown index as primary source (always update when available)
@@ -142,8 +210,8 @@ class OntimeClient:
         has_previous_event = self.cached_has_previous_event
         
         # Check rundown data to detect first/last event
-        rundown = raw_data.get('rundown', {})
-        if isinstance(rundown, dict):
+        rundown = rd_get('rundown', {})
+        if type(rundown) is dict:
             selected_idx = rundown.get('selectedEventIndex')
             num_events = rundown.get('numEvents', 0)
             if selected_idx is not None and num_events > 0:
@@ -154,12 +222,12 @@ class OntimeClient:
                 has_next_event = selected_idx < num_events - 1
                 self.cached_has_next_event = has_next_event
         
-        if isinstance(next_event, dict) and next_event:
+        if type(next_event) is dict and next_event:
             next_title = next_event.get('title', "")
             # Fallback wrap detection: compare timeStart (next before current = wrap)
             if has_next_event:  # Only check if rundown didn't already set to False
                 next_start = next_event.get('timeStart')
-                current_start = current_event.get('timeStart') if isinstance(current_event, dict) else None
+                current_start = ce_get('timeStart') if type(current_event) is dict else None
                 if next_start is not None and current_start is not None and next_start < current_start:
                     has_next_event = False
                     self.cached_has_next_event = False
@@ -167,24 +235,24 @@ class OntimeClient:
             next_title = str(next_event)
 
         # Store current event id and duration for change_current_event_duration
-        if isinstance(current_event, dict) and current_event:
-            eid = current_event.get('id')
+        if type(current_event) is dict and current_event:
+            eid = ce_get('id')
             if eid is not None:
                 self.last_current_event_id = str(eid)
-            dur = current_event.get('duration') or timer_dict.get('duration')
+            dur = ce_get('duration') or td_get('duration')
             if dur is not None:
                 self.last_current_event_duration = float(dur)
 
         # Message/timer display state (blink, blackout) - from message.timer or top-level timer message
-        msg_block = raw_data.get('message') if isinstance(raw_data.get('message'), dict) else None
-        timer_msg = (msg_block.get('timer') or raw_data.get('timer')) if isinstance(msg_block, dict) else raw_data.get('timer')
-        if isinstance(timer_msg, dict):
+        msg_block = rd_get('message')
+        timer_msg = (msg_block.get('timer') or rd_get('timer')) if type(msg_block) is dict else rd_get('timer')
+        if type(timer_msg) is dict:
             if 'blink' in timer_msg:
                 self.last_blink = bool(timer_msg['blink'])
             if 'blackout' in timer_msg:
                 self.last_blackout = bool(timer_msg['blackout'])
         # Also handle payload that is message state only (tag "message" response)
-        if isinstance(raw_data, dict) and 'timer' in raw_data and isinstance(raw_data.get('timer'), dict):
+        if type(rd_get('timer')) is dict:
             t = raw_data['timer']
             if 'blink' in t:
                 self.last_blink = bool(t['blink'])
@@ -193,23 +261,23 @@ class OntimeClient:
 
         # Message-only payload: merge blink/blackout into last_timer_data so we don't reset the display
         if not has_timer_data and self.last_timer_data is not None:
-            if not raw_data.get('currentEvent') and not raw_data.get('eventNow'):
+            if not rd_get('currentEvent') and not rd_get('eventNow'):
                 return replace(self.last_timer_data, blink=self.last_blink, blackout=self.last_blackout)
 
         # Extract thresholds, update cache if present, or use cached values
-        time_warning = current_event.get('timeWarning') or timer_dict.get('timeWarning')
+        time_warning = ce_get('timeWarning') or td_get('timeWarning')
         if time_warning is not None:
             self.cached_time_warning = time_warning
         elif self.cached_time_warning is not None:
             time_warning = self.cached_time_warning
 
-        time_danger = current_event.get('timeDanger') or timer_dict.get('timeDanger')
+        time_danger = ce_get('timeDanger') or td_get('timeDanger')
         if time_danger is not None:
             self.cached_time_danger = time_danger
         elif self.cached_time_danger is not None:
             time_danger = self.cached_time_danger
 
-        duration = current_event.get('duration') or timer_dict.get('duration')
+        duration = ce_get('duration') or td_get('duration')
         if duration is not None:
             self.cached_duration = duration
         elif self.cached_duration is not None:
@@ -218,25 +286,25 @@ class OntimeClient:
         data = TimerData(
             timer_ms=timer_ms,
             timer_type=timer_type,
-            title=current_event.get('title', raw_data.get('title', "")),
+            title=ce_get('title', rd_get('title', "")),
             next_event_title=next_title,
             has_next_event=has_next_event,
             has_previous_event=has_previous_event,
-            status=timer_dict.get('state', raw_data.get('status', "")),
-            running=timer_dict.get('running', raw_data.get('running', False)),
+            status=td_get('state', rd_get('status', "")),
+            running=td_get('running', rd_get('running', False)),
             time_warning=time_warning,
             time_danger=time_danger,
             duration=duration,
             blink=self.last_blink,
             blackout=self.last_blackout,
-            timer_dict=timer_dict,
-            raw_data=raw_data
         )
         
         return data
 
     def _notify(self, data: TimerData):
-        """Invoke update callback with new data."""
+        """Invoke update callback with new data (skipped if identical to the last update)."""
+        if data == self.last_timer_data:
+            return
         self.last_timer_data = data
         if self.update_callback:
             try:
@@ -262,7 +330,8 @@ class OntimeClient:
                 if data: self._notify(data)
 
         try:
-            self.sio.connect(self.server_url, wait_timeout=5)
+            # WebSocket transport only: HTTP long-polling would need the requests package
+            self.sio.connect(self.server_url, transports=['websocket'], wait_timeout=5)
             while not self.stop_event.is_set() and self.websocket_connected:
                 self.stop_event.wait(1)
         except Exception as e:
@@ -271,9 +340,13 @@ class OntimeClient:
             self.websocket_connected = False
 
     def _ws_on_message(self, ws, message):
+        # An exact repeat of the previous frame parses to the same state; skip it
+        if message == self._last_message:
+            return
+        self._last_message = message
         try:
-            raw = json.loads(message)
-            if not isinstance(raw, dict):
+            raw = _loads(message)
+            if type(raw) is not dict:
                 return
             # Handle Ontime format: { "tag": "poll", "payload": {...} } or { "type": "ontime-eventNow", "payload": {...} }
             if 'tag' in raw:
@@ -288,27 +361,37 @@ class OntimeClient:
             logger.error(f"WS message error: {e}")
 
     def _ws_loop(self):
-        """Standard WebSocket loop."""
+        """Standard WebSocket loop; reconnects with exponential backoff until stopped."""
         ws_url = self.server_url.replace('http', 'ws', 1) + "/ws"
-        
+        backoff = RECONNECT_MIN_S
+
         def on_open(ws):
+            nonlocal backoff
             logger.info("WebSocket connected")
             self.websocket_connected = True
-            ws.send(json.dumps({"tag": "poll"}))
+            backoff = RECONNECT_MIN_S
+            ws.send(_MSG_POLL)
 
         def on_close(ws, *args):
             self.websocket_connected = False
 
-        try:
-            self.ws = websocket.WebSocketApp(
-                ws_url,
-                on_message=self._ws_on_message,
-                on_open=on_open,
-                on_close=on_close
-            )
-            self.ws.run_forever()
-        except Exception as e:
-            logger.error(f"WebSocket loop error: {e}")
+        while not self.stop_event.is_set():
+            try:
+                self.ws = websocket.WebSocketApp(
+                    ws_url,
+                    on_message=self._ws_on_message,
+                    on_open=on_open,
+                    on_close=on_close
+                )
+                # Pings detect a half-open connection (e.g. after a network drop) within ~30 s
+                self.ws.run_forever(ping_interval=20, ping_timeout=10)
+            except Exception as e:
+                logger.error(f"WebSocket loop error: {e}")
+            self.websocket_connected = False
+            if self.stop_event.wait(backoff):
+                break
+            logger.info(f"WebSocket reconnecting to {ws_url}")
+            backoff = min(RECONNECT_MAX_S, backoff * 2)
 
     def start(self):
         if self.running: return
@@ -318,51 +401,80 @@ class OntimeClient:
         if self.use_websocket:
             self.ws_thread = Thread(target=self._ws_loop, daemon=True)
             self.ws_thread.start()
+            self._send_queue.clear()
+            self.writer_thread = Thread(target=self._ws_writer_loop, daemon=True)
+            self.writer_thread.start()
 
     def stop(self):
         self.running = False
         self.stop_event.set()
+        self._send_wake.set()
         if self.sio: self.sio.disconnect()
         if self.ws: self.ws.close()
         if self.ws_thread: self.ws_thread.join(timeout=1)
+        if self.writer_thread: self.writer_thread.join(timeout=1)
 
     def test_connection(self) -> bool:
+        """True if the server's host/port accepts a TCP connection."""
         try:
-            return requests.get(self.server_url, timeout=2).status_code < 500
-        except:
+            parts = urlsplit(self.server_url)
+            port = parts.port or (443 if parts.scheme in ('https', 'wss') else 80)
+            socket.create_connection((parts.hostname, port), timeout=0.5).close()
+            return True
+        except (OSError, ValueError):
             return False
 
-    def _send_ws(self, msg: dict) -> bool:
-        """Send a control message over WebSocket. Thread-safe. Returns True if sent."""
+    def _ws_writer_loop(self):
+        """Drain queued control messages onto the WebSocket."""
+        while not self.stop_event.is_set():
+            self._send_wake.wait()
+            self._send_wake.clear()
+            while self._send_queue:
+                text, on_failure = self._send_queue.popleft()
+                try:
+                    if not self.websocket_connected:
+                        raise ConnectionError("not connected")
+                    self.ws.send(text)
+                except Exception as e:
+                    logger.error(f"WebSocket send error, message dropped: {e}")
+                    if on_failure:
+                        on_failure()
+
+    def _send_ws(self, msg: dict, on_failure: Optional[Callable[[], None]] = None) -> bool:
+        """Serialize and queue a control message. Thread-safe. Returns True if queued."""
+        return self._send_ws_raw(_dumps(msg), on_failure)
+
+    def _send_ws_raw(self, text: str, on_failure: Optional[Callable[[], None]] = None) -> bool:
+        """Queue an already-serialized control message for the writer thread.
+
+        Returns False if there is no open connection. on_failure is called on the
+        writer thread if the queued message could not be written.
+        """
         if not WEBSOCKET_AVAILABLE or not self.ws or not self.websocket_connected:
             return False
-        with self._ws_send_lock:
-            try:
-                self.ws.send(json.dumps(msg))
-                return True
-            except Exception as e:
-                logger.error(f"WebSocket send error: {e}")
-                return False
+        self._send_queue.append((text, on_failure))
+        self._send_wake.set()
+        return True
 
     def start_timer(self) -> bool:
         """Start the loaded event."""
-        return self._send_ws({"tag": "start"})
+        return self._send_ws_raw(_MSG_START)
 
     def pause_timer(self) -> bool:
         """Pause the running timer."""
-        return self._send_ws({"tag": "pause"})
+        return self._send_ws_raw(_MSG_PAUSE)
 
     def reload_timer(self) -> bool:
         """Reload/restart the current event."""
-        return self._send_ws({"tag": "reload"})
+        return self._send_ws_raw(_MSG_RELOAD)
 
     def load_next_event(self) -> bool:
         """Load the next event (without starting)."""
-        return self._send_ws({"tag": "load", "payload": "next"})
+        return self._send_ws_raw(_MSG_LOAD_NEXT)
 
     def load_previous_event(self) -> bool:
         """Load the previous event (without starting)."""
-        return self._send_ws({"tag": "load", "payload": "previous"})
+        return self._send_ws_raw(_MSG_LOAD_PREVIOUS)
 
     def add_time_ms(self, ms: int) -> bool:
         """Add time to the running timer (e.g. 60000 for +1 minute)."""
@@ -380,15 +492,19 @@ class OntimeClient:
         if new_duration < 0:
             new_duration = 0
         msg = {"tag": "change", "payload": {self.last_current_event_id: {"duration": new_duration}}}
-        if not self._send_ws(msg):
+        if not self._send_ws(msg, self._forget_event_duration):
             return False
         self.last_current_event_duration = new_duration
         return True
 
+    def _forget_event_duration(self):
+        """Drop the locally assumed duration after a failed change; the next server update restores it."""
+        self.last_current_event_duration = None
+
     def set_timer_blackout(self, blackout: bool) -> bool:
         """Set timer screen blackout on or off."""
-        return self._send_ws({"tag": "message", "payload": {"timer": {"blackout": blackout}}})
+        return self._send_ws_raw(_MSG_BLACKOUT[bool(blackout)])
 
     def set_timer_blink(self, blink: bool) -> bool:
         """Set timer blink on or off."""
-        return self._send_ws({"tag": "message", "payload": {"timer": {"blink": blink}}})
+        return self._send_ws_raw(_MSG_BLINK[bool(blink)])
@@ -26,6 +26,31 @@ _BTN_STYLE = """
 
 _OVERLAY_STYLE = "background-color: rgba(0, 0, 0, 180); border-radius: 8px;"
 
+# One sheet per overlay: the bare overlay style as a universal rule, with the
+# (more specific) QPushButton rules cascading to every button
+_OVERLAY_SHEET = "* { " + _OVERLAY_STYLE + " }" + _BTN_STYLE
+
+
+# Button fonts by point size, shared by all overlays (created lazily: needs the QApplication)
+_BUTTON_FONTS = {}
+
+
+def _button_font(size: int) -> QFont:
+    font = _BUTTON_FONTS.get(size)
+    if font is None:
+        font = _BUTTON_FONTS[size] = QFont("Arial", size, QFont.Weight.Bold)
+    return font
+
+
+def _make_button(text: str, font: QFont, signal) -> QPushButton:
+    """Create a fixed-size circular control button that emits signal on click."""
+    btn = QPushButton(text)
+    btn.setFont(font)
+    btn.setCursor(Qt.CursorShape.PointingHandCursor)
+    btn.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+    btn.clicked.connect(signal.emit)
+    return btn
+
 
 class TopControlOverlay(QWidget):
     """Top overlay with +1 and -1 minute buttons."""
@@ -35,7 +60,6 @@ class TopControlOverlay(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setMouseTracking(True)
         self.setup_ui()
 
     def setup_ui(self):
@@ -43,25 +67,15 @@ class TopControlOverlay(QWidget):
         layout.setSpacing(8)
         layout.setContentsMargins(8, 6, 8, 6)
 
+        font = _button_font(12)
         # -1 and +1 buttons (order: -1 on left, +1 on right)
-        remove_btn = QPushButton("-1")
-        remove_btn.setStyleSheet(_BTN_STYLE)
-        remove_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        remove_btn.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        remove_btn.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        remove_btn.clicked.connect(self.remove_minute_clicked.emit)
-
-        add_btn = QPushButton("+1")
-        add_btn.setStyleSheet(_BTN_STYLE)
-        add_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        add_btn.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        add_btn.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        add_btn.clicked.connect(self.add_minute_clicked.emit)
-
-        layout.addWidget(remove_btn)
-        layout.addWidget(add_btn)
-
-        self.setStyleSheet(_OVERLAY_STYLE)
+        for text, signal in (
+            ("-1", self.remove_minute_clicked),
+            ("+1", self.add_minute_clicked),
+        ):
+            layout.addWidget(_make_button(text, font, signal))
+
+        self.setStyleSheet(_OVERLAY_SHEET)
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         self.adjustSize()
 
@@ -77,7 +91,6 @@ class BottomControlOverlay(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setMouseTracking(True)
         self.setup_ui()
 
     def setup_ui(self):
@@ -85,52 +98,16 @@ class BottomControlOverlay(QWidget):
         layout.setSpacing(8)
         layout.setContentsMargins(8, 6, 8, 6)
 
-        _icon_font = QFont("Arial", 14, QFont.Weight.Bold)
-
-        # Previous event
-        prev_btn = QPushButton("\u2039")  # Single left angle
-        prev_btn.setStyleSheet(_BTN_STYLE)
-        prev_btn.setFont(_icon_font)
-        prev_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        prev_btn.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        prev_btn.clicked.connect(self.previous_clicked.emit)
-
-        # Play, Pause, Restart
-        play_btn = QPushButton("\u25B6")  # Play triangle
-        play_btn.setStyleSheet(_BTN_STYLE)
-        play_btn.setFont(_icon_font)
-        play_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        play_btn.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        play_btn.clicked.connect(self.start_clicked.emit)
-
-        pause_btn = QPushButton("\u23F8")  # Pause
-        pause_btn.setStyleSheet(_BTN_STYLE)
-        pause_btn.setFont(_icon_font)
-        pause_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        pause_btn.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        pause_btn.clicked.connect(self.pause_clicked.emit)
-
-        restart_btn = QPushButton("\u21BB")  # Restart / redo
-        restart_btn.setStyleSheet(_BTN_STYLE)
-        restart_btn.setFont(_icon_font)
-        restart_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        restart_btn.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        restart_btn.clicked.connect(self.restart_clicked.emit)
-
-        # Next event
-        next_btn = QPushButton("\u203A")  # Single right angle
-        next_btn.setStyleSheet(_BTN_STYLE)
-        next_btn.setFont(_icon_font)
-        next_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        next_btn.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        next_btn.clicked.connect(self.next_clicked.emit)
-
-        layout.addWidget(prev_btn)
-        layout.addWidget(play_btn)
-        layout.addWidget(pause_btn)
-        layout.addWidget(restart_btn)
-        layout.addWidget(next_btn)
-
-        self.setStyleSheet(_OVERLAY_STYLE)
+        icon_font = _button_font(14)
+        for text, signal in (
+            ("\u2039", self.previous_clicked),  # Single left angle (previous event)
+            ("\u25B6", self.start_clicked),     # Play triangle
+            ("\u23F8", self.pause_clicked),     # Pause
+            ("\u21BB", self.restart_clicked),   # Restart / redo
+            ("\u203A", self.next_clicked),      # Single right angle (next event)
+        ):
+            layout.addWidget(_make_button(text, icon_font, signal))
+
+        self.setStyleSheet(_OVERLAY_SHEET)
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         self.adjustSize()
@@ -1,17 +1,78 @@
 """Widget for displaying Ontime timer."""
 import math
 import sys
+import time
 from pathlib import Path
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout, QSizePolicy
-from PyQt6.QtCore import Qt, QTimer, QPointF
+from PyQt6.QtCore import Qt, QTimer, QPointF, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QFont, QMouseEvent, QFontMetrics, QFontDatabase
-from typing import Optional
-from datetime import datetime
+from typing import Dict, Optional
 from logger import get_logger
 from ontime_client import TimerData
 
 logger = get_logger(__name__)
 
+# Point size at which fit_font_size measures text before scaling to the available space
+_REF_FONT_SIZE = 100
+# Timer label stylesheets for the colors in use, built once
+_COLOR_STYLES = {c: f"color: {c};" for c in ("#ffffff", "#888888", "#FA5656", "#FFA528")}
+# Zero-padded "00".."99" for _format_time
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+# Upper bound on TimerWidget's fitted-font cache entries
+_FONT_CACHE_MAX = 64
+
+
+def fit_font_size(family: str, text: str, avail_w: float, avail_h: float, bold: bool = True) -> int:
+    """Find largest font size for text that fits avail_w x avail_h.
+    Touches no widgets, so it is safe to run on a pool thread."""
+    min_size, max_size = 8, 300  # Size bounds
+    # Try to use as much space as possible (90% width, 98% height to avoid clipping)
+    max_w = avail_w * 0.90
+    max_h = avail_h * 0.98
+    # One QFont for the whole search; only its point size changes per step
+    font = QFont(family, _REF_FONT_SIZE, QFont.Weight.Bold if bold else QFont.Weight.Normal)
+
+    def fits(size: int) -> bool:
+        font.setPointSize(size)
+        metrics = QFontMetrics(font)
+        return metrics.horizontalAdvance(text) <= max_w and metrics.height() <= max_h
+
+    # Advance and height scale ~linearly with point size: estimate from one measurement
+    # at a reference size, then step to correct for hinting/rounding (usually 1-2 steps)
+    metrics = QFontMetrics(font)
+    ref_w = metrics.horizontalAdvance(text) or 1
+    ref_h = metrics.height() or 1
+    size = int(min(max_w / ref_w, max_h / ref_h) * _REF_FONT_SIZE)
+    size = max(min_size, min(max_size, size))
+    while size < max_size and fits(size + 1):
+        size += 1
+    while size > min_size and not fits(size):
+        size -= 1
+    return size
+
+
+class _FontSizeSignals(QObject):
+    """Carries pool-thread font size results back to the GUI thread."""
+    done = pyqtSignal(int, object)  # generation, [(label attribute name, text, point size)]
+
+
+class _FontSizeJob(QRunnable):
+    """Computes label font sizes off the GUI thread (see TimerWidget.update_font_sizes_async)."""
+
+    def __init__(self, signals: _FontSizeSignals, generation: int, family: str, items, avail_w: int, avail_h: int):
+        super().__init__()
+        self.signals = signals
+        self.generation = generation
+        self.family = family
+        self.items = items
+        self.avail_w = avail_w
+        self.avail_h = avail_h
+
+    def run(self):
+        sizes = [(name, text, fit_font_size(self.family, text, self.avail_w, self.avail_h)) for name, text in self.items]
+        self.signals.done.emit(self.generation, sizes)
+
+
 class TimerWidget(QWidget):
     """Widget that displays the Ontime timer and/or clock."""
     
@@ -33,7 +94,18 @@ class TimerWidget(QWidget):
         self._blink_timer = QTimer(self)
         self._blink_timer.timeout.connect(self._blink_tick)
         self._blink_visible = True
+        self._clock_second = None
+        self._clock_font_set = False  # Clock text is always HH:MM:SS: size once per display
+        self._clock_str = ""
         self._display_font_family = self._load_display_font()
+        # Async font sizing: results from superseded requests are dropped by generation
+        self._font_generation = 0
+        self._font_signals = _FontSizeSignals(self)
+        self._font_signals.done.connect(self._apply_computed_font_sizes)
+        # Fitted fonts keyed by (avail_w, avail_h, text length): digits are fixed-width in both
+        # Iosevka Fixed and Arial, so same-length texts in the same space get the same size
+        self._font_cache: Dict[tuple, QFont] = {}
+        self._pending_font_area = (0, 0)
         self.setup_ui()
         self.setup_clock_timer()
     
@@ -61,7 +133,8 @@ class TimerWidget(QWidget):
         # Timer label (for Ontime timer)
         self.timer_label = QLabel("--:--")
         self.timer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.timer_label.setStyleSheet("color: #ffffff;")
+        self._timer_color = None
+        self._set_timer_color("#ffffff")
         
         # Clock label (for system clock)
         self.clock_label = QLabel("")
@@ -97,32 +170,46 @@ class TimerWidget(QWidget):
     def setup_clock_timer(self):
         """Setup timer for updating clock display."""
         self.clock_timer = QTimer(self)
+        self.clock_timer.setInterval(1000)
         self.clock_timer.timeout.connect(self.update_clock)
-        
-        # Calculate delay to sync with the start of the next second
-        now = datetime.now()
-        delay_ms = 1000 - (now.microsecond // 1000)
-        self.clock_timer.setSingleShot(True)
-        self.clock_timer.timeout.connect(self._start_regular_clock_updates)
-        self.clock_timer.start(delay_ms)
+        self._clock_sync_pending = False
+        self._sync_clock_timer()
         self.update_clock()
 
+    def _needs_clock(self) -> bool:
+        return self.display_mode == 'clock' or self.timer_type == 'clock'
+
+    def _sync_clock_timer(self):
+        """Run the 1 Hz clock timer only while a clock is shown (and the widget is visible)."""
+        if not (self.isVisible() and self._needs_clock()):
+            self.clock_timer.stop()
+            return
+        if self.clock_timer.isActive() or self._clock_sync_pending:
+            return
+        # Calculate delay to sync with the start of the next second; the repeating
+        # timer starts there, so each tick dispatches to update_clock only
+        self._clock_sync_pending = True
+        delay_ms = 1000 - int(time.time() * 1000) % 1000
+        QTimer.singleShot(delay_ms, self._start_regular_clock_updates)
+
+    @pyqtSlot()
     def _start_regular_clock_updates(self):
-        self.clock_timer.setSingleShot(False)
-        self.clock_timer.start(1000)
-        self.update_clock()
+        self._clock_sync_pending = False
+        if self.isVisible() and self._needs_clock():
+            self.clock_timer.start()
+            self.update_clock()
     
+    @pyqtSlot()
     def update_clock(self):
         """Update the clock display with current system time."""
         if self.display_mode == 'clock' or (self.timer_type == 'clock' and self.display_mode == 'timer'):
-            now = datetime.now()
-            time_str = now.strftime("%H:%M:%S")
+            time_str = self._clock_text()
             target = self.clock_label if self.display_mode == 'clock' else self.timer_label
             if target.text() != time_str:
                 target.setText(time_str)
                 # Font size should stay constant for clock (always HH:MM:SS)
                 # Only update on first display
-                if not hasattr(self, '_clock_font_set'):
+                if not self._clock_font_set:
                     self.update_font_sizes()
                     self._clock_font_set = True
             if self.display_mode == 'clock':
@@ -131,14 +218,25 @@ class TimerWidget(QWidget):
             self.clock_label.setText("")
             self._clock_font_set = False
 
+    def _clock_text(self) -> str:
+        """Current local time as HH:MM:SS, formatted at most once per wall-clock second."""
+        now_s = int(time.time())
+        if now_s != self._clock_second:
+            self._clock_second = now_s
+            lt = time.localtime(now_s)
+            self._clock_str = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+        return self._clock_str
+
     def set_display_mode(self, mode: str):
         """Set display mode: 'timer' or 'clock'."""
         if mode not in ['timer', 'clock'] or self.display_mode == mode:
             return
         
         self.display_mode = mode
+        self._clock_font_set = False
         self.update_display_mode()
         self.update_clock()
+        self._sync_clock_timer()
         if self.timer_data:
             self.update_timer(self.timer_data)
         self.update_font_sizes()
@@ -152,7 +250,9 @@ class TimerWidget(QWidget):
     def update_timer(self, data: TimerData):
         """Update the timer display with structured TimerData."""
         self.timer_data = data
-        self.timer_type = data.timer_type
+        if data.timer_type != self.timer_type:
+            self.timer_type = data.timer_type
+            self._sync_clock_timer()
         
         if self.display_mode != 'timer':
             return
@@ -162,10 +262,10 @@ class TimerWidget(QWidget):
         if data.timer_type == 'none':
             self.timer_label.setVisible(True)
             self.timer_label.setText("--:--")
-            self.timer_label.setStyleSheet("color: #888888;")  # Dimmed when idle
+            self._set_timer_color("#888888")  # Dimmed when idle
         elif data.timer_type == 'clock':
             self.timer_label.setVisible(True)
-            self.timer_label.setStyleSheet("color: #ffffff;")
+            self._set_timer_color("#ffffff")
             self.update_clock()
         else:
             self.timer_label.setVisible(True)
@@ -180,10 +280,10 @@ class TimerWidget(QWidget):
                 elif data.timer_type == 'count up':
                     color = self._get_timer_color_countup(data.timer_ms, data.duration)
                 
-                self.timer_label.setStyleSheet(f"color: {color};")
+                self._set_timer_color(color)
             elif data.status == 'stopped' or data.timer_type == 'none':
                 self.timer_label.setText("--:--")
-                self.timer_label.setStyleSheet("color: #ffffff;")
+                self._set_timer_color("#ffffff")
 
         # Only resize if text length changed (e.g., MM:SS -> HH:MM:SS)
         new_text = self.timer_label.text()
@@ -198,9 +298,15 @@ class TimerWidget(QWidget):
         if timer_type == 'count down':
             total_sec = abs(math.ceil(ms / 1000))
         else:
-            total_sec = int(abs(ms) / 1000)
-        h, m, s = total_sec // 3600, (total_sec % 3600) // 60, total_sec % 60
-        time_str = f"{h:02d}:{m:02d}:{s:02d}" if h > 0 else f"{m:02d}:{s:02d}"
+            total_sec = abs(int(ms)) // 1000
+        h, rem = divmod(total_sec, 3600)
+        m, s = divmod(rem, 60)
+        if h == 0:
+            time_str = _TWO_DIGITS[m] + ":" + _TWO_DIGITS[s]
+        elif h < 100:
+            time_str = _TWO_DIGITS[h] + ":" + _TWO_DIGITS[m] + ":" + _TWO_DIGITS[s]
+        else:
+            time_str = f"{h}:{_TWO_DIGITS[m]}:{_TWO_DIGITS[s]}"
         # Minus only when strictly negative and at least 1 full second (no -0:00)
         if ms < 0 and total_sec > 0:
             return f"-{time_str}"
@@ -226,18 +332,25 @@ class TimerWidget(QWidget):
                     )
                 elif self.timer_data.timer_type == 'count up' and self.timer_data.timer_ms is not None:
                     color = self._get_timer_color_countup(self.timer_data.timer_ms, self.timer_data.duration)
-                self.timer_label.setStyleSheet(f"color: {color};")
+                self._set_timer_color(color)
             return
         # Blink: toggle opacity
         if not self._blink_timer.isActive():
             self._blink_visible = True
             self._blink_timer.start(500)
 
+    @pyqtSlot()
     def _blink_tick(self):
         """Toggle timer label visibility for blink effect."""
         self._blink_visible = not self._blink_visible
         self.timer_label.setVisible(self._blink_visible)
 
+    def _set_timer_color(self, color: str):
+        """Set the timer text color; skips the stylesheet re-parse when unchanged."""
+        if color != self._timer_color:
+            self._timer_color = color
+            self.timer_label.setStyleSheet(_COLOR_STYLES.get(color) or f"color: {color};")
+
     def _get_timer_color_countdown(self, ms: float, warning: Optional[float], danger: Optional[float]) -> str:
         if ms < 0: return "#FA5656" # Red
         if danger is not None and ms <= danger: return "#FA5656"
@@ -248,61 +361,96 @@ class TimerWidget(QWidget):
         if duration is not None and ms > duration: return "#FFA528"
         return "#ffffff"
 
-    def update_font_sizes(self, width: int = None, height: int = None):
-        """Dynamically scale fonts to fill the window - text adapts to window size."""
+    def _font_sizing_targets(self, width: int = None, height: int = None):
+        """Return (avail_w, avail_h, [(label attribute name, text)]) to size, or None if too small."""
         width = width or self.width()
         height = height or self.height()
         
         if width < 50 or height < 50:
-            return
+            return None
 
         # Use layout margins (from setup_ui)
         margin = self.base_margin
         avail_w = width - (2 * margin)
         avail_h = height - (2 * margin)
-        
-        def calculate_optimal_font_size(label, bold=True):
-            """Find largest font size that fits the window."""
-            if not label.isVisible() or not label.text():
-                return
-            
-            text = label.text()
-            min_size, max_size = 8, 300  # Search range
-            
-            # Binary search for optimal font size
-            best_size = min_size
-            for _ in range(20):  # More iterations for better precision
-                mid_size = (min_size + max_size) // 2
-                font = QFont(self._display_font_family, mid_size, QFont.Weight.Bold if bold else QFont.Weight.Normal)
-                metrics = QFontMetrics(font)
-                
-                text_width = metrics.horizontalAdvance(text)
-                text_height = metrics.height()
-                
-                # Try to use as much space as possible (98% to avoid clipping)
-                fits = text_width <= avail_w * 0.90 and text_height <= avail_h * 0.98
-                
-                if fits:
-                    best_size = mid_size
-                    min_size = mid_size + 1  # Try even larger
-                else:
-                    max_size = mid_size - 1  # Too big, go smaller
-            
-            # Set the font with the best size found
-            font = QFont(self._display_font_family, best_size, QFont.Weight.Bold if bold else QFont.Weight.Normal)
-            label.setFont(font)
-            
-        calculate_optimal_font_size(self.timer_label, bold=True)
-        calculate_optimal_font_size(self.clock_label, bold=True)
+        items = [
+            (name, label.text())
+            for name, label in (('timer_label', self.timer_label), ('clock_label', self.clock_label))
+            if label.isVisible() and label.text()
+        ]
+        return avail_w, avail_h, items
+
+    def _cache_font(self, avail_w: int, avail_h: int, text: str, size: int) -> QFont:
+        """Store and return the fitted font for this area and text length."""
+        if len(self._font_cache) >= _FONT_CACHE_MAX:
+            self._font_cache.clear()  # Resize drags visit many areas; keep only recent ones
+        font = QFont(self._display_font_family, size, QFont.Weight.Bold)
+        self._font_cache[(avail_w, avail_h, len(text))] = font
+        return font
+
+    def _apply_cached_fonts(self, avail_w: int, avail_h: int, items):
+        """Set fonts for items with a cached fit; return the items still to be computed."""
+        misses = []
+        for name, text in items:
+            font = self._font_cache.get((avail_w, avail_h, len(text)))
+            if font is None:
+                misses.append((name, text))
+            else:
+                getattr(self, name).setFont(font)
+        return misses
+
+    def update_font_sizes(self, width: int = None, height: int = None):
+        """Dynamically scale fonts to fill the window - text adapts to window size."""
+        self._font_generation += 1  # Supersede any pending async result
+        targets = self._font_sizing_targets(width, height)
+        if targets is None:
+            return
+        avail_w, avail_h, items = targets
+        for name, text in self._apply_cached_fonts(avail_w, avail_h, items):
+            size = fit_font_size(self._display_font_family, text, avail_w, avail_h)
+            getattr(self, name).setFont(self._cache_font(avail_w, avail_h, text, size))
+
+    def update_font_sizes_async(self, width: int = None, height: int = None):
+        """Like update_font_sizes, but run the metric search on the global QThreadPool
+        and apply the fonts on the GUI thread when done (used for interactive resize)."""
+        self._font_generation += 1
+        targets = self._font_sizing_targets(width, height)
+        if targets is None or not targets[2]:
+            return
+        avail_w, avail_h, items = targets
+        misses = self._apply_cached_fonts(avail_w, avail_h, items)
+        if not misses:
+            return
+        self._pending_font_area = (avail_w, avail_h)
+        job = _FontSizeJob(self._font_signals, self._font_generation, self._display_font_family, misses, avail_w, avail_h)
+        QThreadPool.globalInstance().start(job)
+
+    @pyqtSlot(int, object)
+    def _apply_computed_font_sizes(self, generation: int, sizes):
+        """Set label fonts from computed point sizes (GUI thread). Stale results are ignored."""
+        if generation != self._font_generation:
+            return
+        avail_w, avail_h = self._pending_font_area
+        for name, text, size in sizes:
+            getattr(self, name).setFont(self._cache_font(avail_w, avail_h, text, size))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_clock()  # May have been stale while hidden
+        self._sync_clock_timer()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.clock_timer.stop()
 
     def mouseMoveEvent(self, event: QMouseEvent):
         """Forward events to parent for cursor handling."""
         parent = self.parent()
         if parent:
-            global_pos = self.mapToGlobal(event.position().toPoint())
-            parent_pos = parent.mapFromGlobal(global_pos)
+            # Direct child: parent coordinates are just local position + our offset
+            parent_pos = event.position() + QPointF(self.pos())
             parent_event = QMouseEvent(
-                event.type(), QPointF(parent_pos), event.globalPosition(),
+                event.type(), parent_pos, event.globalPosition(),
                 event.button(), event.buttons(), event.modifiers()
             )
             parent.mouseMoveEvent(parent_event)
@@ -1,9 +1,11 @@
 """Configuration dialog for setting Ontime server URL."""
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-    QLineEdit, QPushButton, QMessageBox
+    QDialog, QDialogButtonBox, QFormLayout, QVBoxLayout, QLabel,
+    QLineEdit, QMessageBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSlot
+
+_URL_SCHEMES = ("http://", "https://")
 
 
 class ConfigDialog(QDialog):
@@ -33,33 +35,31 @@ class ConfigDialog(QDialog):
         layout.addWidget(info_label)
         
         # URL input
-        url_layout = QHBoxLayout()
-        url_label = QLabel("Server URL:")
         self.url_input = QLineEdit()
         self.url_input.setText(self.current_url)
         self.url_input.setPlaceholderText("http://localhost:4001")
+        form = QFormLayout()
+        form.addRow("Server URL:", self.url_input)
+        layout.addLayout(form)
         
-        url_layout.addWidget(url_label)
-        url_layout.addWidget(self.url_input)
-        layout.addLayout(url_layout)
-        
-        # Buttons
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
-        
-        self.cancel_button = QPushButton("Cancel")
-        self.cancel_button.clicked.connect(self.reject)
-        
-        self.ok_button = QPushButton("OK")
-        self.ok_button.clicked.connect(self.accept_config)
-        self.ok_button.setDefault(True)
-        
-        button_layout.addWidget(self.cancel_button)
-        button_layout.addWidget(self.ok_button)
-        layout.addLayout(button_layout)
+        # Buttons (platform order; OK is the default button)
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.accepted.connect(self.accept_config)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
         
         self.setLayout(layout)
     
+    def set_url(self, url: str):
+        """Reset the dialog for another run with url prefilled."""
+        self.current_url = url
+        self.result_url = None
+        self.url_input.setText(url)
+        self.url_input.setFocus()
+
+    @pyqtSlot()
     def accept_config(self):
         """Validate and accept the configuration."""
         url = self.url_input.text().strip()
@@ -73,7 +73,7 @@ class ConfigDialog(QDialog):
             return
         
         # Basic URL validation
-        if not (url.startswith("http://") or url.startswith("https://")):
+        if not url.startswith(_URL_SCHEMES):
             QMessageBox.warning(
                 self,
                 "Invalid URL",